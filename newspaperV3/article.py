@@ -281,8 +281,7 @@ class Article(object):
             self.url,
             self.clean_doc,    # target document
             self.top_node,     # node from source document
-            self.doc,
-            debug=False)
+            self.doc)
         
         if self.top_node is not None:
             video_extractor = VideoExtractor(self.config, self.top_node)
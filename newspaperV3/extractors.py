@@ -12,13 +12,17 @@ __license__ = 'MIT'
 __copyright__ = 'Copyright 2014, Lucas Ou-Yang'
 
 import copy
+import functools
+import heapq
 import logging
+import operator
 import re
-from collections import defaultdict
+import string
+from collections import defaultdict, deque
 
 from dateutil.parser import parse as date_parser
 from tldextract import tldextract
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
 
 from . import urls
 from .utils import StringReplacement, StringSplitter
@@ -26,6 +30,12 @@ from .utils import StringReplacement, StringSplitter
 import dateparser
 from datetime import datetime, timedelta
 
+try:
+    import ahocorasick
+except ImportError:
+    # The pure-Python automaton in DateFinder is used instead
+    ahocorasick = None
+
 log = logging.getLogger(__name__)
 
 MOTLEY_REPLACEMENT = StringReplacement("&#65533;", "")
@@ -52,19 +62,40 @@ bad_chunks = ['careers', 'contact', 'about', 'faq', 'terms', 'privacy',
               'advert', 'preferences', 'feedback', 'info', 'browse', 'howto',
               'account', 'subscribe', 'donate', 'shop', 'admin']
 bad_domains = ['amazon', 'doubleclick', 'twitter']
-
-
+category_stopwords = [
+    'about', 'help', 'privacy', 'legal', 'feedback', 'sitemap',
+    'profile', 'account', 'mobile', 'sitemap', 'facebook', 'myspace',
+    'twitter', 'linkedin', 'bebo', 'friendster', 'stumbleupon',
+    'youtube', 'vimeo', 'store', 'mail', 'preferences', 'maps',
+    'password', 'imgur', 'flickr', 'search', 'subscription', 'itunes',
+    'siteindex', 'events', 'stop', 'jobs', 'careers', 'newsletter',
+    'subscribe', 'academy', 'shopping', 'purchase', 'site-map',
+    'shop', 'donate', 'newsletter', 'product', 'advert', 'info',
+    'tickets', 'coupons', 'forum', 'board', 'archive', 'browse',
+    'howto', 'how to', 'faq', 'terms', 'charts', 'services',
+    'contact', 'plus', 'admin', 'login', 'signup', 'register',
+    'developer', 'proxy']
+# Any stopword anywhere in a category's path or subdomain, in one search
+_CATEGORY_STOPWORD_RE = re.compile('|'.join(
+    map(re.escape, dict.fromkeys(category_stopwords))))
+
+
+
+
+_AR_NORM_TABLE = str.maketrans({
+    'إ': 'ا', 'أ': 'ا', 'آ': 'ا',
+    'ى': 'ي',
+    'ة': 'ه',
+    # Remove diacritics
+    **{chr(c): None for c in range(0x064B, 0x0653)},
+})
 
 
 def normalize_arabic(text):
     """Normalizes Arabic text to a consistent form for matching."""
     if not text:
         return text
-    text = re.sub(r'[إأآا]', 'ا', text)
-    text = re.sub(r'[ى]', 'ي', text)
-    text = re.sub(r'[ة]', 'ه', text)
-    text = re.sub(r'[\u064B-\u0652]', '', text) # Remove diacritics
-    return text
+    return text.translate(_AR_NORM_TABLE)
 
 # A simplified dictionary containing ONLY month names.
 # This makes our Trie a highly specialized and fast month-finder.
@@ -83,6 +114,20 @@ DATE_KEYWORDS = {
     ]
 }
 
+
+def _normalize_date_text(text):
+    """The normalization shared by the month keywords and the text they
+    are searched in.
+    """
+    return normalize_arabic(text.lower())
+
+
+# DATE_KEYWORDS normalized and deduplicated once at import, shortest first.
+_NORMALIZED_DATE_KEYWORDS = {
+    lang: sorted({_normalize_date_text(w) for w in words}, key=lambda w: (len(w), w))
+    for lang, words in DATE_KEYWORDS.items()
+}
+
 DATE_CLEANING_REGEXES = {
     'en': re.compile(r'^(Published|Updated|Posted on|Last updated|on)\s*[:]?\s*', re.IGNORECASE),
     'es': re.compile(r'^(Publicado|Actualizado)\s*(el)?\s*[:]?\s*', re.IGNORECASE),
@@ -90,6 +135,277 @@ DATE_CLEANING_REGEXES = {
     'fr': re.compile(r'^(Publié|Mise à jour)\s*(le)?\s*[:]?\s*', re.IGNORECASE),
     'ar': re.compile(r'^(نشر في|تاريخ النشر|تحديث)\s*[:]?\s*', re.IGNORECASE),
 }
+# All of the above in one anchored regex. Chaining the prefixes as optional
+# groups strips them in the same order as applying each regex in turn.
+_DATE_PREFIX_RE = re.compile(
+    r'^' + ''.join('(?:%s)?' % r.pattern[1:]
+                   for r in DATE_CLEANING_REGEXES.values()),
+    re.IGNORECASE)
+
+# Patterns used while picking and parsing date candidates, compiled once
+# at import instead of on every candidate.
+
+# Day Month Year, with the month name in English or Arabic
+_TEXT_DATE_RE = re.compile(
+    r"""
+    (?:
+        \b\d{1,2}[-\s/.,th|st|nd|rd]*   # Optional day
+        \b(?:[a-zA-Z\u0621-\u064A]{3,})\b # Month name (Eng or Ara)
+        (?:[-\s/.,|]*)                  # Separator
+        \d{1,2}[-\s/.,th|st|nd|rd]*      # Day or Year
+        (?:[-\s/.,|]*)                  # Separator
+        \b\d{2,4}\b                     # Year
+    )
+    """, re.VERBOSE | re.IGNORECASE)
+
+# YYYY-MM-DD or similar formats embedded in text
+_NUMERIC_DATE_RE = re.compile(
+    r"""
+    (
+        \b(19|20)\d{2}                     # Year (YYYY)
+        [-/.]                             # Separator
+        (0?[1-9]|1[0-2])                  # Month (MM)
+        [-/.]                             # Separator
+        (0?[1-9]|[12][0-9]|3[01])          # Day (DD)
+        (?:[\s|]*                          # Optional space or pipe
+        (?:[0-2]?\d:[0-5]\d)?)?            # Optional time (HH:MM)
+    )
+    """, re.VERBOSE)
+
+# The three patterns above fused into a single regex. Each alternative is
+# a lookahead anchored at the start of the text, so alternatives keep
+# their priority order (parenthesized, then text, then numeric) while the
+# text is handed to the regex engine only once.
+_BEST_DATE_RE = re.compile(
+    r'\A(?:(?=.*?\((?P<paren>[^)]+\d{4}[^)]+)\))'
+    r'|(?=.*?(?P<text>' + _TEXT_DATE_RE.pattern + r'))'
+    r'|(?=.*?(?P<numeric>' + _NUMERIC_DATE_RE.pattern + r')))',
+    re.VERBOSE | re.IGNORECASE | re.DOTALL)
+
+_ISO_RE = re.compile(
+    r'\b(\d{4})[-./](\d{1,2})[-./](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?\b')
+_URL_DATE_RES = [re.compile(p) for p in (
+    r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # MM/DD/YYYY or DD/MM/YYYY
+)]
+# Date in an article URL, e.g. /2019/05/06/
+_STRICT_URL_DATE_RE = re.compile(urls.STRICT_DATE_REGEX)
+# Timezone suffixes that confuse dateparser
+_TZ_CLEAN_RES = [re.compile(p) for p in (
+    r'\s*-\s*GMT\s*\([^)]+\)\s*',  # - GMT (+3 )
+    r'\s*GMT\s*[+-]\d{1,2}\s*',    # GMT+3
+    r'\s*UTC\s*[+-]\d{1,2}\s*',    # UTC+3
+    r'\s*\([^)]*GMT[^)]*\)\s*',    # (GMT+3)
+)]
+# DATE_ORDER detection for text dates, checked in priority order:
+#   ymd: ISO format, YYYY-MM-DD, YYYY/MM/DD, or YYYY.MM.DD
+#   mdy: American format, M/D/YYYY or MM/DD/YYYY (month 1-12, day 1-31)
+#   dmy: European format, D/M/YYYY or DD/MM/YYYY (day 1-31, month 1-12)
+# Anchored lookaheads keep that priority within a single regex search.
+_DATE_ORDER_RE = re.compile(
+    r'\A(?:(?=.*?(?P<ymd>\d{4}[-./]\d{1,2}[-./]\d{1,2}))'
+    r'|(?=.*?(?P<mdy>(?:[1-9]|1[0-2])/(?:[1-9]|[12][0-9]|3[01])/\d{4}))'
+    r'|(?=.*?(?P<dmy>(?:[1-9]|[12][0-9]|3[01])/(?:[1-9]|1[0-2])/\d{4})))',
+    re.DOTALL)
+_DATE_ORDERS = {'ymd': 'YMD', 'mdy': 'MDY', 'dmy': 'DMY'}
+
+
+def _keywords_re(keywords):
+    """One regex finding any of `keywords` as a substring, so a string is
+    scanned once instead of once per keyword
+    """
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# Heuristic candidate filtering in get_publishing_date. The strict patterns
+# are matched against lowercased text; any one of them is enough.
+_STRICT_DATE_PATTERNS = [
+    # Clear date formats with numbers
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # 12/31/2025
+    r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',    # 2025/12/31
+    r'\b\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b',
+    r'\b\d{1,2}\s+(يناير|فبراير|مارس|أبريل|مايو|يونيو|يوليو|أغسطس|سبتمبر|أكتوبر|نوفمبر|ديسمبر)\s*,?\s*\d{4}\b',
+    r'\b\d{1,2}\s+(enero|febrero|marzo|abril|mayo|junio|julio|agosto|septiembre|octubre|noviembre|diciembre)\s+\d{4}\b',
+
+    # Time patterns
+    r'\b([01]?\d|2[0-3]):[0-5]\d\b',       # HH:MM
+    r'\b\d{1,2}:\d{2}\s*(am|pm|ص|م)\b',    # 12:30 PM
+
+    # Day + Date patterns
+    r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b',
+    r'\b(الاثنين|الثلاثاء|الأربعاء|الخميس|الجمعة|السبت|الأحد)\s*\d{1,2}\s*(يناير|فبراير|مارس|أبريل|مايو|يونيو|يوليو|أغسطس|سبتمبر|أكتوبر|نوفمبر|ديسمبر)\s*,?\s*\d{4}\b',
+
+    # ISO format dates
+    r'\b\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',
+
+    # Published/Updated with date
+    r'\b(published|updated|posted|created|تاريخ|نشر|محدث)\s*:?\s*\d',
+]
+_STRICT_DATE_RE = re.compile('|'.join('(?:%s)' % p for p in _STRICT_DATE_PATTERNS))
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_DATE_WORDS = [
+    # English
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+
+    # Arabic - be more specific
+    'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو',
+    'يوليو', 'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر',
+    'الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد',
+]
+# Whole words only, so e.g. 'mayor' or 'marsh' is not taken for a month
+_DATE_WORD_RE = re.compile(r'\b(?:%s)\b' % '|'.join(map(re.escape, _DATE_WORDS)))
+_YMD_DATE_RE = re.compile(r'\b(19|20)\d{2}[-/.](0[1-9]|1[0-2])[-/.](0[1-9]|[12][0-9]|3[01])\b')
+_ISO_EMBED_RE = re.compile(r'\b\d{4}-\d{1,2}-\d{1,2}(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?\b')
+
+# Candidate scoring keywords, matched against lowercased text/class/id
+_DATE_ATTR_RE = _keywords_re(['date', 'time', 'publish', 'created', 'updated', 'data-publishdate'])
+_CANDIDATE_PUB_KEYWORD_RE = _keywords_re(['published', 'posted', 'created', 'date', 'time', 'updated', 'modified'])
+_DATE_CLASS_RE = _keywords_re(['publish', 'timestamp', 'date', 'entry-date', 'post-date', 'time'])
+_DATE_ID_RE = _keywords_re(['publish', 'date', 'time', 'created', 'updated'])
+_TITLE_ATTR_RE = _keywords_re(['title', 'headline', 'heading'])
+
+_DATE_CANDIDATE_TAGS = ('p', 'span', 'div', 'td', 'time')
+_TITLE_CANDIDATE_TAGS = ('h1', 'h2', 'h3', 'p')
+# Content in these is probably not about the article itself
+_PENALTY_TAGS = ('nav', 'aside', 'sidebar', 'footer')
+
+
+def _attr_contains(attr, value):
+    """XPath predicate matching `value` case-insensitively as a substring
+    of `attr`, the same test getElementsByTag builds
+    """
+    return 'contains(translate(@%s, "%s", "%s"), "%s")' % (
+        attr, string.ascii_uppercase, string.ascii_lowercase, value.lower())
+
+
+# Lowercases ASCII only, like the translate() in getElementsByTag XPaths
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Tags holding the publishing date, in priority order. Values are matched
+# case-insensitively as substrings of the attribute, like getElementsByTag.
+PUBLISH_DATE_TAGS = [
+    {'attribute': 'property', 'value': 'article:published_time'},
+    {'attribute': 'itemprop', 'value': 'datePublished'},
+    {'attribute': 'name', 'value': 'pubdate'},
+    {'attribute': 'pubdate', 'value': 'pubdate'},
+    {'attribute': 'name', 'value': 'published_time'},
+    {'attribute': 'name', 'value': 'publish_date'},
+    {'attribute': 'property', 'value': 'og:published_time'},
+    {'attribute': 'name', 'value': 'date'},
+    {'attribute': 'name', 'value': 'Date'},
+    {'attribute': 'name', 'value': 'DC.date.issued'},
+    {'attribute': 'name', 'value': 'dcterms.created'},
+    {'attribute': 'name', 'value': 'OriginalPublicationDate'},
+    {'attribute': 'name', 'value': 'sailthru.date'},
+    {'attribute': 'name', 'value': 'article_date_original'},
+    {'attribute': 'name', 'value': 'publication_date'},
+    {'attribute': 'name', 'value': 'PublishDate'},
+    {'attribute': 'name', 'value': 'datePublished'},
+    {'attribute': 'property', 'value': 'rnews:datePublished'},
+    {'attribute': 'name', 'value': 'datePublished'},
+    {'attribute': 'span', 'value': 'data-publishdate'},
+]
+
+
+def _publish_date_lookups(tags):
+    """(attribute, value, lowercased value, attribute holding the date) for
+    each of `tags`, dropping repeats that would match the same way
+    """
+    lookups, seen = [], set()
+    for tag_info in tags:
+        attr, value = tag_info['attribute'], tag_info['value']
+        content_key = 'datetime' if value == 'datePublished' else 'content'
+        key = (attr, value.lower(), content_key)
+        if key not in seen:
+            seen.add(key)
+            lookups.append((attr, value, value.lower(), content_key))
+    return lookups
+
+
+_PUBLISH_DATE_LOOKUPS = _publish_date_lookups(PUBLISH_DATE_TAGS)
+# Every lookup plus <time> in a single predicate, so the tree is walked once
+_PUBLISH_DATE_XPATH = 'descendant-or-self::*[%s or self::time]' % ' or '.join(
+    _attr_contains(attr, needle) for attr, value, needle, content_key in _PUBLISH_DATE_LOOKUPS)
+
+
+# Byline parsing
+_DIGITS_RE = re.compile(r'\d')
+_HTML_TAG_RE = re.compile('<[^<]+?>')
+_BYLINE_RE = re.compile(r'[bB][yY][\:\s]|[fF]rom[\:\s]')
+_NAME_SPLIT_RE = re.compile(r"[^\w\'\-\.]")
+_BYLINE_DELIMITERS = frozenset(['and', ',', ''])
+
+# Attribute/value pairs marking author elements, in priority order. Values
+# are matched case-insensitively as substrings, like getElementsByTag.
+AUTHOR_ATTRS = ['name', 'rel', 'itemprop', 'class', 'id']
+AUTHOR_VALS = ['author', 'byline', 'dc.creator', 'byl']
+_AUTHOR_PAIRS = [(attr, val) for attr in AUTHOR_ATTRS for val in AUTHOR_VALS]
+# Every pair in a single predicate, so the tree is walked only once
+_AUTHOR_XPATH = 'descendant-or-self::*[%s]' % ' or '.join(
+    _attr_contains(attr, val) for attr, val in _AUTHOR_PAIRS)
+
+# Link tags read by get_canonical_link, get_favicon and get_feed_urls
+_CANONICAL_XPATH = 'descendant::link[%s]' % _attr_contains('rel', 'canonical')
+_FAVICON_XPATH = 'descendant::link[%s]' % _attr_contains('rel', 'icon')
+_FEED_XPATH = 'descendant-or-self::*[%s]' % _attr_contains('type', 'application/rss+xml')
+
+# Raw-text url search in get_urls. One character class, spelling out what
+# the old `[$-_]` range let through (slashes, colons, query characters...),
+# so that the match set is unchanged; an escaped `%XX` is covered by it too
+_URL_FINDALL_RE = re.compile(r"https?://[A-Za-z0-9!$%&'()*+,\-./:;<=>?@\[\\\]^_]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _meta_path_hostname_re(hostname):
+    """Matches a meta url path that still carries `hostname`, the same
+    article hostname comes up for every link of a source
+    """
+    return re.compile(".*{}(?=/)/(.*)".format(hostname))
+
+
+# get_category_urls looks at the same page and category urls several times
+_cached_urlparse = functools.lru_cache(maxsize=4096)(urlparse)
+_cached_tldextract = functools.lru_cache(maxsize=4096)(tldextract.extract)
+
+
+def _complete_category_url(p_url):
+    """Gives a scheme-less category url the http scheme and drops one
+    trailing slash
+    """
+    if p_url.startswith('://'):
+        p_url = 'http' + p_url
+    elif p_url.startswith('//'):
+        p_url = 'http:' + p_url
+    if p_url.endswith('/'):
+        p_url = p_url[:-1]
+    return p_url
+
+
+# Anything urljoin would not hand back as written: non printable ascii,
+# params, brackets, empty queries or fragments and dot segments
+_URLJOIN_UNSAFE_RE = re.compile(
+    r'[^\x21-\x7e]|[;\[\]\\]|\?#|[?#]\Z|/\.\.?(?:[/?#]|\Z)')
+
+
+def _fast_urljoin(base_url, base_split, url):
+    """urljoin(base_url, url), where base_split is urlsplit(base_url),
+    without parsing either url again for the usual absolute, protocol
+    relative and root relative src values
+    """
+    if (base_split.scheme in ('http', 'https') and base_split.netloc
+            and not _URLJOIN_UNSAFE_RE.search(url)):
+        if url.startswith(('http://', 'https://')):
+            if url[url.index('//') + 2:][:1] not in ('', '/', '?', '#'):
+                return url
+        elif url.startswith('//'):
+            if url[2:3] not in ('', '/', '?', '#'):
+                return base_split.scheme + ':' + url
+        elif url.startswith('/'):
+            return base_split.scheme + '://' + base_split.netloc + url
+    return urljoin(base_url, url)
+
 
 # In newspaperV3/extractors.py
 
@@ -146,65 +462,225 @@ PUBLICATION_KEYWORDS = [
 
 class TrieNode:
     """A node in the Trie structure for keyword searching."""
+    __slots__ = ('children', 'is_end_of_word', 'fail')
+
     def __init__(self):
-        self.children = defaultdict(TrieNode)
+        self.children = {}
         self.is_end_of_word = False
+        self.fail = None
 
 class DateFinder:
-    """A helper class to find month names in text using a Trie."""
+    """A helper class to find month names in text using an Aho-Corasick
+    automaton (a Trie with failure links), so a text is scanned in a
+    single linear pass. The `pyahocorasick` C extension is used when it
+    is installed; otherwise the automaton is flattened into a table of
+    per-state transition dicts, so each character costs one dict lookup.
+
+    `keywords_dict` must already be normalized with `_normalize_date_text`,
+    like `_NORMALIZED_DATE_KEYWORDS`.
+    """
+    # Transition target meaning a keyword has just been matched
+    ACCEPT = -1
+
     def __init__(self, keywords_dict):
+        self.automaton = None
+        self.transitions = None
         self.root = TrieNode()
-        self._build_trie(keywords_dict)
+        if ahocorasick is not None:
+            self._build_automaton(keywords_dict)
+        else:
+            self._build_trie(keywords_dict)
+            self._build_failure_links()
+            self._build_transitions()
+
+    def _build_automaton(self, keywords_dict):
+        self.automaton = ahocorasick.Automaton()
+        for lang, words in keywords_dict.items():
+            for word in words:
+                self.automaton.add_word(word, True)
+        self.automaton.make_automaton()
 
     def _build_trie(self, keywords_dict):
         for lang, words in keywords_dict.items():
             for word in words:
-                # All keywords are stored in lowercase. Arabic keywords are already normalized.
-                processed_word = word.lower()
                 node = self.root
-                for char in processed_word:
-                    node = node.children[char]
+                for char in word:
+                    nxt = node.children.get(char)
+                    if nxt is None:
+                        nxt = TrieNode()
+                        node.children[char] = nxt
+                    node = nxt
                 node.is_end_of_word = True
 
+    def _build_failure_links(self):
+        """BFS over the Trie computing the failure link of every node.
+        """
+        root = self.root
+        root.fail = root
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in node.children.items():
+                fail = node.fail
+                while fail is not root and char not in fail.children:
+                    fail = fail.fail
+                child.fail = fail.children.get(char, root)
+                # A node also accepts if any suffix of its path is a keyword.
+                child.is_end_of_word |= child.fail.is_end_of_word
+                queue.append(child)
+
+    def _build_transitions(self):
+        """Resolves the failure links ahead of time: state i maps every
+        character to its next state, leaving out those that fall back to
+        the root (state 0). Accepting states are never left, as
+        `contains_month` stops at the first match, so they get no row.
+        """
+        root = self.root
+        states = {root: 0}
+        rows = [{}]
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            # The failure target is shallower, so its row is already built.
+            row = dict(rows[states[node.fail]]) if node is not root else {}
+            for char, child in node.children.items():
+                if child.is_end_of_word:
+                    row[char] = self.ACCEPT
+                else:
+                    states[child] = len(rows)
+                    rows.append(None)
+                    queue.append(child)
+                    row[char] = states[child]
+            rows[states[node]] = row
+        self.transitions = rows
+
     def contains_month(self, text):
         """
         Efficiently checks if any month name exists in the given text.
+        Text without a single digit can't hold a usable date (no day or
+        year), so it is rejected before scanning for month names.
         """
+        if not _DIGITS_RE.search(text):
+            return False
+
         # Normalize the input text to match how keywords are stored in the Trie.
-        normalized_text = normalize_arabic(text.lower())
-        
-        for i in range(len(normalized_text)):
-            node = self.root
-            for j in range(i, len(normalized_text)):
-                char = normalized_text[j]
-                if char not in node.children:
-                    break
-                node = node.children[char]
-                if node.is_end_of_word:
-                    # Found a keyword. We don't need to know which one, just that it exists.
-                    return True
+        normalized_text = _normalize_date_text(text)
+
+        if self.automaton is not None:
+            return next(self.automaton.iter(normalized_text), None) is not None
+
+        transitions = self.transitions
+        accept = self.ACCEPT
+        state = 0
+        for char in normalized_text:
+            state = transitions[state].get(char, 0)
+            if state == accept:
+                # Found a keyword. We don't need to know which one, just that it exists.
+                return True
         return False
-    
 
 
+# The automaton is read-only once built, so every extractor shares one.
+_SHARED_DATE_FINDER = DateFinder(_NORMALIZED_DATE_KEYWORDS)
+
+
+def _element_fingerprint(node):
+    """Positional path of `node` from its root as (tag, index) steps, the
+    same steps getpath() emits: index counts same-tag siblings from 1 and
+    is None when the tag is unique among its siblings
+    """
+    fingerprint = []
+    while node is not None:
+        index = 1
+        for _ in node.itersiblings(node.tag, preceding=True):
+            index += 1
+        if index == 1 and next(node.itersiblings(node.tag), None) is None:
+            index = None
+        fingerprint.append((node.tag, index))
+        node = node.getparent()
+    fingerprint.reverse()
+    return fingerprint
+
+
+def _find_by_fingerprint(root, fingerprint):
+    """First node in document order reached by following `fingerprint`
+    down from `root`, as evaluating the matching getpath() XPath would;
+    an index-less step matches every child with that tag
+    """
+    if not fingerprint or fingerprint[0][0] != root.tag:
+        return None
+    stack = [(root, 1)]
+    while stack:
+        node, depth = stack.pop()
+        if depth == len(fingerprint):
+            return node
+        tag, index = fingerprint[depth]
+        if index is None:
+            children = list(node.iterchildren(tag))
+            children.reverse()
+            stack.extend((child, depth + 1) for child in children)
+        else:
+            for child in node.iterchildren(tag):
+                index -= 1
+                if not index:
+                    stack.append((child, depth + 1))
+                    break
+    return None
+
+
+def _ancestor_depths(node):
+    """Maps `node` and each of its ancestors to its number of steps up
+    from `node`. Elements are keyed directly, not by id(), so the dict
+    keeps their proxies (and identities) alive
+    """
+    depths = {node: 0}
+    for steps, ancestor in enumerate(node.iterancestors(), 1):
+        depths[ancestor] = steps
+    return depths
 
-# From original file, kept for compatibility
-MOTLEY_REPLACEMENT = StringReplacement("&#65533;", "")
-ESCAPED_FRAGMENT_REPLACEMENT = StringReplacement("#!", "?_escaped_fragment_=")
-TITLE_REPLACEMENTS = StringReplacement("&raquo;", "»")
-PIPE_SPLITTER = StringSplitter(r"\|")
-DASH_SPLITTER = StringSplitter(" - ")
-UNDERSCORE_SPLITTER = StringSplitter("_")
-SLASH_SPLITTER = StringSplitter("/")
-ARROWS_SPLITTER = StringSplitter(" » ")
-COLON_SPLITTER = StringSplitter(":")
-SPACE_SPLITTER = StringSplitter(' ')
-NO_STRINGS = set()
-A_REL_TAG_SELECTOR = "a[rel=tag]"
-A_HREF_TAG_SELECTOR = ("a[href*='/tag/'], a[href*='/tags/'], "
-                       "a[href*='/topic/'], a[href*='?keyword=']")
-RE_LANG = r'^[A-Za-z]{2}$'
 
+def _dom_distance(node, reference_depths):
+    """Number of steps between `node` and the reference node whose
+    `_ancestor_depths` are given, through their closest common ancestor.
+    Nodes in different trees are infinitely far apart.
+    """
+    depth = reference_depths.get(node)
+    if depth is not None:
+        return depth
+    for steps, ancestor in enumerate(node.iterancestors(), 1):
+        depth = reference_depths.get(ancestor)
+        if depth is not None:
+            return steps + depth
+    return float('inf')
+
+
+class _Candidate:
+    """A scored date or title candidate."""
+    __slots__ = ('score', 'text', 'debug', 'tag')
+
+    def __init__(self, score, text, debug, tag=None):
+        self.score = score
+        self.text = text
+        self.debug = debug
+        self.tag = tag
+
+
+_by_score = operator.attrgetter('score')
+
+
+def _iter_by_score(candidates):
+    """Yields `candidates` best score first, ties in their original order,
+    like a stable reverse sort. The heap is popped lazily, so callers that
+    stop at the first acceptable candidate don't pay for a full sort.
+    """
+    heap = [(-candidate.score, i) for i, candidate in enumerate(candidates)]
+    heapq.heapify(heap)
+    while heap:
+        yield candidates[heapq.heappop(heap)[1]]
 
 
 class ContentExtractor(object):
@@ -213,60 +689,62 @@ class ContentExtractor(object):
         self.parser = self.config.get_parser()
         self.language = config.language
         self.stopwords_class = config.stopwords_class
-        self.date_finder = DateFinder(DATE_KEYWORDS)
+        self.date_finder = _SHARED_DATE_FINDER
+        # Ancestor depths per node id(), only valid within a single
+        # get_publishing_date call
+        self._ancestor_cache = {}
+        # Stopwords objects per (stopwords class, language)
+        self._stopwords = {}
+        # Stopword count per text, for the stopwords object it was counted
+        # with; only kept for the document calculate_best_node last ran on
+        self._stopword_counts = {}
+        self._stopword_counts_of = None
+
+    def _get_stopwords(self):
+        """Returns the stopwords object of the current language, each one
+        is only built once
+        """
+        key = (self.stopwords_class, self.language)
+        stopwords = self._stopwords.get(key)
+        if stopwords is None:
+            stopwords = self.stopwords_class(language=self.language)
+            self._stopwords[key] = stopwords
+        return stopwords
+
+    def _count_stopwords(self, text):
+        """Number of stopwords in text. calculate_best_node and the sibling
+        checks after it look at the same paragraphs over and over, each text
+        is only counted once
+        """
+        stopwords = self._get_stopwords()
+        if stopwords is not self._stopword_counts_of:
+            self._stopword_counts = {}
+            self._stopword_counts_of = stopwords
+        count = self._stopword_counts.get(text)
+        if count is None:
+            count = stopwords.get_stopword_count(text).get_stopword_count()
+            self._stopword_counts[text] = count
+        return count
 
     def _extract_best_date_string(self, text):
         """
         A creative pipeline to extract the most likely date string from a candidate text.
         """
-        # 1. Structural check: Date in parentheses
-        match = re.search(r'\(([^)]+\d{4}[^)]+)\)', text)
+        # 1. Language-aware prefix stripping. The prefixes never contain a
+        # parenthesis, so this cannot affect the structural check below.
+        cleaned_text = _DATE_PREFIX_RE.sub('', text, count=1)
+
+        # 2. One pass, in priority order, over:
+        #   - a structural date in parentheses
+        #   - a full date with a month name (Day Month Year)
+        #   - YYYY-MM-DD or similar numeric formats embedded in text
+        match = _BEST_DATE_RE.search(cleaned_text)
         if match:
-            return match.group(1).strip()
+            for group in ('paren', 'text', 'numeric'):
+                if match.group(group) is not None:
+                    return match.group(group).strip()
 
-        # 2. Language-aware prefix stripping
-        cleaned_text = text
-        for lang_regex in DATE_CLEANING_REGEXES.values():
-            cleaned_text = lang_regex.sub('', cleaned_text)
-        
-        # 3. Comprehensive text-based pattern matching (Day Month Year)
-        # This regex looks for a full date with a month name.
-        text_date_pattern = re.compile(
-            r"""
-            (?:
-                \b\d{1,2}[-\s/.,th|st|nd|rd]*   # Optional day
-                \b(?:[a-zA-Z\u0621-\u064A]{3,})\b # Month name (Eng or Ara)
-                (?:[-\s/.,|]*)                  # Separator
-                \d{1,2}[-\s/.,th|st|nd|rd]*      # Day or Year
-                (?:[-\s/.,|]*)                  # Separator
-                \b\d{2,4}\b                     # Year
-            )
-            """, re.VERBOSE | re.IGNORECASE)
-        
-        match = text_date_pattern.search(cleaned_text)
-        if match:
-            return match.group(0).strip()
-            
-        # 4. **CRUCIAL ADDITION**: Numeric-only pattern matching
-        # This will find YYYY-MM-DD or similar formats embedded in text.
-        numeric_date_pattern = re.compile(
-            r"""
-            (
-                \b(19|20)\d{2}                     # Year (YYYY)
-                [-/.]                             # Separator
-                (0?[1-9]|1[0-2])                  # Month (MM)
-                [-/.]                             # Separator
-                (0?[1-9]|[12][0-9]|3[01])          # Day (DD)
-                (?:[\s|]*                          # Optional space or pipe
-                (?:[0-2]?\d:[0-5]\d)?)?            # Optional time (HH:MM)
-            )
-            """, re.VERBOSE)
-            
-        match = numeric_date_pattern.search(cleaned_text)
-        if match:
-            return match.group(0).strip()
-
-        # 5. Fallback to return the partially cleaned text if no specific pattern is found.
+        # 3. Fallback to return the partially cleaned text if no specific pattern is found.
         return cleaned_text.strip()
     def update_language(self, meta_lang):
         """Required to be called before the extraction process in some
@@ -282,23 +760,19 @@ class ContentExtractor(object):
         """Fetch the authors of the article, return as a list
         Only works for english articles
         """
-        _digits = re.compile(r'\d')
-
         def contains_digits(d):
-            return bool(_digits.search(d))
+            return bool(_DIGITS_RE.search(d))
 
         def uniqify_list(lst):
             """Remove duplicates from provided list but maintain original order.
               Derived from http://www.peterbe.com/plog/uniqifiers-benchmark
             """
+            # dicts keep insertion order, so the first spelling of each
+            # name wins and its position is preserved
             seen = {}
-            result = []
             for item in lst:
-                if item.lower() in seen:
-                    continue
-                seen[item.lower()] = 1
-                result.append(item.title())
-            return result
+                seen.setdefault(item.lower(), item)
+            return [item.title() for item in seen.values()]
 
         def parse_byline(search_str):
             """
@@ -308,26 +782,25 @@ class ContentExtractor(object):
             ['Lucas Ou-Yang', 'Alex Smith']
             """
             # Remove HTML boilerplate
-            search_str = re.sub('<[^<]+?>', '', search_str)
+            search_str = _HTML_TAG_RE.sub('', search_str)
 
             # Remove original By statement
-            search_str = re.sub(r'[bB][yY][\:\s]|[fF]rom[\:\s]', '', search_str)
+            search_str = _BYLINE_RE.sub('', search_str)
 
             search_str = search_str.strip()
 
             # Chunk the line by non alphanumeric tokens (few name exceptions)
             # >>> re.split("[^\w\'\-\.]", "Tyler G. Jones, Lucas Ou, Dean O'Brian and Ronald")
             # ['Tyler', 'G.', 'Jones', '', 'Lucas', 'Ou', '', 'Dean', "O'Brian", 'and', 'Ronald']
-            name_tokens = re.split(r"[^\w\'\-\.]", search_str)
-            name_tokens = [s.strip() for s in name_tokens]
+            # Whitespace is a separator, so the tokens never need stripping
+            name_tokens = _NAME_SPLIT_RE.split(search_str)
 
             _authors = []
             # List of first, last name tokens
             curname = []
-            delimiters = ['and', ',', '']
 
             for token in name_tokens:
-                if token in delimiters:
+                if token in _BYLINE_DELIMITERS:
                     if len(curname) > 0:
                         _authors.append(' '.join(curname))
                         curname = []
@@ -344,16 +817,19 @@ class ContentExtractor(object):
 
         # Try 1: Search popular author tags for authors
 
-        ATTRS = ['name', 'rel', 'itemprop', 'class', 'id']
-        VALS = ['author', 'byline', 'dc.creator', 'byl']
-        matches = []
+        def author_rank(node):
+            # Index of the first attribute/value pair the node matches
+            for rank, (attr, val) in enumerate(_AUTHOR_PAIRS):
+                if val in node.get(attr, '').lower():
+                    return rank
+            return len(_AUTHOR_PAIRS)
+
         authors = []
 
-        for attr in ATTRS:
-            for val in VALS:
-                # found = doc.xpath('//*[@%s="%s"]' % (attr, val))
-                found = self.parser.getElementsByTag(doc, attr=attr, value=val)
-                matches.extend(found)
+        # Visit the matches grouped by pair priority, then document order,
+        # as if each pair had been searched separately
+        matches = self.parser.xpath(doc, _AUTHOR_XPATH)
+        matches.sort(key=author_rank)
 
         for match in matches:
             content = ''
@@ -378,26 +854,32 @@ class ContentExtractor(object):
         #    return [] # Failed to find anything
         # return authors
 
-    def get_publishing_date(self, url, original_doc, top_node=None, source_doc=None, debug=False):
+    def get_publishing_date(self, url, original_doc, top_node=None, source_doc=None):
         """
         Final, robust, tiered strategy for finding the publication date.
         - Tiers 1 & 2 use the original, untouched document for maximum reliability.
         - Heuristic tiers use distance-based scoring relative to top_node.
-        [DEBUG VERSION]
+        Set this module's logger to DEBUG to trace the decisions made.
         """
-        import re
-        from datetime import datetime, timedelta
-        if debug: print("\n[DEBUG] --- Starting get_publishing_date ---")
+        debug = log.isEnabledFor(logging.DEBUG)
+        log.debug("--- Starting get_publishing_date ---")
         now = datetime.now()
+        self._ancestor_cache.clear()
+        distance_cache = {}
+        # The same date text often sits in several tags (and in each of
+        # their wrappers), so both checks are memoized for this call
+        parse_cache = {}
+        date_text_cache = {}
 
         def parse_and_validate(date_str, from_heuristic=False, from_url=False):
+            key = (date_str, from_heuristic, from_url)
+            if key not in parse_cache:
+                parse_cache[key] = _parse_and_validate(date_str, from_heuristic, from_url)
+            return parse_cache[key]
+
+        def _parse_and_validate(date_str, from_heuristic, from_url):
             if not date_str: return None
-            
-            # Import required modules at function start
-            import re
-            import dateparser
-            from datetime import datetime, timedelta
-            
+
             try:
                 # Handle common URL date formats explicitly
                 if from_url:
@@ -405,13 +887,8 @@ class ContentExtractor(object):
                     clean_url_date = date_str.strip('/')
                     
                     # Try common URL patterns first
-                    url_patterns = [
-                        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
-                        r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # MM/DD/YYYY or DD/MM/YYYY
-                    ]
-                    
-                    for pattern in url_patterns:
-                        match = re.search(pattern, clean_url_date)
+                    for pattern in _URL_DATE_RES:
+                        match = pattern.search(clean_url_date)
                         if match:
                             g1, g2, g3 = match.groups()
                             
@@ -420,11 +897,10 @@ class ContentExtractor(object):
                                 try:
                                     year, month, day = int(g1), int(g2), int(g3)
                                     if 1 <= month <= 12 and 1 <= day <= 31:
-                                        from datetime import datetime as dt_class
-                                        dt = dt_class(year, month, day)
-                                        if debug: print(f"  [DEBUG] URL Pattern Match: {clean_url_date} → {dt}")
+                                        dt = datetime(year, month, day)
+                                        log.debug("URL Pattern Match: %s → %s", clean_url_date, dt)
                                         return dt
-                                except (ValueError, ImportError):
+                                except ValueError:
                                     pass
                             
                             # Otherwise try DD/MM/YYYY or MM/DD/YYYY
@@ -433,30 +909,25 @@ class ContentExtractor(object):
                                 try:
                                     day, month, year = int(g1), int(g2), int(g3)
                                     if 1 <= month <= 12 and 1 <= day <= 31:
-                                        from datetime import datetime as dt_class
-                                        dt = dt_class(year, month, day)
-                                        if debug: print(f"  [DEBUG] URL Pattern Match (DD/MM/YYYY): {clean_url_date} → {dt}")
+                                        dt = datetime(year, month, day)
+                                        log.debug("URL Pattern Match (DD/MM/YYYY): %s → %s", clean_url_date, dt)
                                         return dt
-                                except (ValueError, ImportError):
+                                except ValueError:
                                     pass
                                     
                                 # Fall back to MM/DD/YYYY
                                 try:
                                     month, day, year = int(g1), int(g2), int(g3)
                                     if 1 <= month <= 12 and 1 <= day <= 31:
-                                        from datetime import datetime as dt_class
-                                        dt = dt_class(year, month, day)
-                                        if debug: print(f"  [DEBUG] URL Pattern Match (MM/DD/YYYY): {clean_url_date} → {dt}")
+                                        dt = datetime(year, month, day)
+                                        log.debug("URL Pattern Match (MM/DD/YYYY): %s → %s", clean_url_date, dt)
                                         return dt
-                                except (ValueError, ImportError):
+                                except ValueError:
                                     pass
                 
                 # Detect ISO format dates and handle them correctly
-                # Look for ISO dates in the original string first
-                iso_pattern = r'\b(\d{4})[-./](\d{1,2})[-./](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?\b'
-                
                 # Try ISO format in original string first
-                iso_match = re.search(iso_pattern, date_str)
+                iso_match = _ISO_RE.search(date_str)
                 
                 if iso_match:
                     # Handle ISO format explicitly to avoid DATE_ORDER confusion
@@ -468,9 +939,8 @@ class ContentExtractor(object):
                         second = int(second) if second else 0
                         
                         if 1 <= month <= 12 and 1 <= day <= 31:
-                            from datetime import datetime as dt_class
-                            dt = dt_class(year, month, day, hour, minute, second)
-                            if debug: print(f"  [DEBUG] ISO Format Match: {iso_match.group(0)} → {dt}")
+                            dt = datetime(year, month, day, hour, minute, second)
+                            log.debug("ISO Format Match: %s → %s", iso_match.group(0), dt)
                             
                             # Handle timezone comparison
                             if dt.tzinfo is not None and now.tzinfo is None:
@@ -486,14 +956,14 @@ class ContentExtractor(object):
                             future_threshold = timedelta(hours=24) if from_heuristic else timedelta(days=7)
                             
                             if dt_naive > comparison_time + future_threshold:
-                                if debug: print(f"  [DEBUG] REJECTED (Future Date): Parsed '{date_str}' to {dt} (threshold: {future_threshold})")
+                                log.debug("REJECTED (Future Date): Parsed '%s' to %s (threshold: %s)", date_str, dt, future_threshold)
                                 return None
                             
-                            if debug: print(f"  [DEBUG] ACCEPTED: Parsed '{date_str}' to {dt}")
+                            log.debug("ACCEPTED: Parsed '%s' to %s", date_str, dt)
                             return dt
                             
-                    except (ValueError, ImportError):
-                        if debug: print(f"  [DEBUG] ISO Format parsing failed, falling back to dateparser")
+                    except ValueError:
+                        log.debug("ISO Format parsing failed, falling back to dateparser")
                         pass
                 
                 # Try parsing with original string first
@@ -504,9 +974,9 @@ class ContentExtractor(object):
                     best_substring = self._extract_best_date_string(date_str)
                     if best_substring != date_str and best_substring:
                         parsing_attempts.append(best_substring)
-                        if debug: print(f"  [DEBUG PARSER] Will try cleaned string '{best_substring}' if original fails")
+                        log.debug("Will try cleaned string '%s' if original fails", best_substring)
                 
-                if debug: print(f"  [DEBUG] Parsing attempts: {parsing_attempts}")
+                log.debug("Parsing attempts: %s", parsing_attempts)
                 
                 # Try each parsing attempt
                 for attempt_str in parsing_attempts:
@@ -516,17 +986,11 @@ class ContentExtractor(object):
                     # Clean timezone suffixes that confuse dateparser
                     clean_attempt = attempt_str
                     # Remove common problematic timezone patterns
-                    timezone_patterns = [
-                        r'\s*-\s*GMT\s*\([^)]+\)\s*',  # - GMT (+3 )
-                        r'\s*GMT\s*[+-]\d{1,2}\s*',    # GMT+3
-                        r'\s*UTC\s*[+-]\d{1,2}\s*',    # UTC+3
-                        r'\s*\([^)]*GMT[^)]*\)\s*',    # (GMT+3)
-                    ]
-                    for pattern in timezone_patterns:
-                        clean_attempt = re.sub(pattern, '', clean_attempt).strip()
+                    for pattern in _TZ_CLEAN_RES:
+                        clean_attempt = pattern.sub('', clean_attempt).strip()
                     
-                    if debug and clean_attempt != attempt_str:
-                        print(f"  [DEBUG] Cleaned timezone: '{attempt_str}' → '{clean_attempt}'")
+                    if clean_attempt != attempt_str:
+                        log.debug("Cleaned timezone: '%s' → '%s'", attempt_str, clean_attempt)
                         
                     # Fall back to dateparser with appropriate settings
                     if from_url:
@@ -534,65 +998,57 @@ class ContentExtractor(object):
                         settings = {'DATE_ORDER': 'YMD'}
                     else:
                         # Improved date order detection for text dates
-                        if re.search(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}', clean_attempt):
-                            # ISO format: YYYY-MM-DD, YYYY/MM/DD, or YYYY.MM.DD
-                            settings = {'DATE_ORDER': 'YMD'}
-                            if debug: print(f"  [DEBUG] Detected ISO format (YMD) in: {clean_attempt}")
-                        elif re.search(r'([1-9]|1[0-2])/([1-9]|[12][0-9]|3[01])/\d{4}', clean_attempt):
-                            # American format: M/D/YYYY or MM/DD/YYYY (month 1-12, day 1-31)
-                            settings = {'DATE_ORDER': 'MDY'}
-                            if debug: print(f"  [DEBUG] Detected American format (MDY) in: {clean_attempt}")
-                        elif re.search(r'([1-9]|[12][0-9]|3[01])/([1-9]|1[0-2])/\d{4}', clean_attempt):
-                            # European format: D/M/YYYY or DD/MM/YYYY (day 1-31, month 1-12)  
-                            settings = {'DATE_ORDER': 'DMY'}
-                            if debug: print(f"  [DEBUG] Detected European format (DMY) in: {clean_attempt}")
+                        order_match = _DATE_ORDER_RE.search(clean_attempt)
+                        if order_match:
+                            settings = {'DATE_ORDER': _DATE_ORDERS[order_match.lastgroup]}
+                            log.debug("Detected %s format in: %s", settings['DATE_ORDER'], clean_attempt)
                         else:
                             # Default to MDY for ambiguous cases (common in web content)
                             settings = {'DATE_ORDER': 'MDY'}
-                            if debug: print(f"  [DEBUG] Using default MDY format for: {clean_attempt}")
+                            log.debug("Using default MDY format for: %s", clean_attempt)
 
-                    if debug: print(f"  [DEBUG] Trying dateparser with '{clean_attempt}' using {settings}")
+                    log.debug("Trying dateparser with '%s' using %s", clean_attempt, settings)
                     dt = dateparser.parse(clean_attempt, settings=settings)
                     
                     if not dt:
-                        if debug: print(f"  [DEBUG] dateparser failed to parse: '{clean_attempt}'")
+                        log.debug("dateparser failed to parse: '%s'", clean_attempt)
                         continue  # Try next parsing attempt
                     
                     if dt:
-                        if debug: print(f"  [DEBUG] dateparser result: {dt}")
+                        log.debug("dateparser result: %s", dt)
                         
                         # Handle timezone-aware vs naive datetime comparison
                         if dt.tzinfo is not None and now.tzinfo is None:
                             # Convert timezone-aware dt to naive for comparison
                             dt_naive = dt.replace(tzinfo=None)
                             comparison_time = now
-                            if debug: print(f"  [DEBUG] Converted timezone-aware to naive: {dt_naive}")
+                            log.debug("Converted timezone-aware to naive: %s", dt_naive)
                         elif dt.tzinfo is None and now.tzinfo is not None:
                             # Convert naive dt to timezone-aware using UTC
                             dt_naive = dt
                             comparison_time = now.replace(tzinfo=None)
-                            if debug: print(f"  [DEBUG] Using naive datetime for comparison")
+                            log.debug("Using naive datetime for comparison")
                         else:
                             # Both are same type (both naive or both aware)
                             dt_naive = dt
                             comparison_time = now
-                            if debug: print(f"  [DEBUG] Same timezone types")
+                            log.debug("Same timezone types")
                         
                         # More lenient future date check for metadata
                         future_threshold = timedelta(hours=24) if from_heuristic else timedelta(days=7)
                         
-                        if debug: print(f"  [DEBUG] Comparing {dt_naive} vs {comparison_time} (threshold: {future_threshold})")
+                        log.debug("Comparing %s vs %s (threshold: %s)", dt_naive, comparison_time, future_threshold)
                         
                         if dt_naive > comparison_time + future_threshold:
-                            if debug: print(f"  [DEBUG] REJECTED (Future Date): Parsed '{attempt_str}' to {dt} (threshold: {future_threshold})")
+                            log.debug("REJECTED (Future Date): Parsed '%s' to %s (threshold: %s)", attempt_str, dt, future_threshold)
                             continue  # Try next parsing attempt
                             
-                        if debug: print(f"  [DEBUG] ACCEPTED: Parsed '{attempt_str}' to {dt}")
+                        log.debug("ACCEPTED: Parsed '%s' to %s", attempt_str, dt)
                         return dt
                 
                 return None
             except Exception as e:
-                if debug: print(f"  [DEBUG] PARSING ERROR: {e}")
+                log.debug("PARSING ERROR: %s", e)
                 return None
         def find_corresponding_node(source_node, source_doc, target_doc):
             """Find corresponding node using multiple strategies."""
@@ -600,72 +1056,58 @@ class ContentExtractor(object):
                 return None
                 
             try:
-                source_tree = source_doc.getroottree()
-                source_xpath = source_tree.getpath(source_node)
-                if debug: print(f"[DEBUG] INFO: Source node XPath: '{source_xpath}'")
-                
                 target_tree = target_doc.getroottree()
-                
-                # Strategy 1: Try exact XPath match
-                corresponding_nodes = target_tree.xpath(source_xpath)
-                if corresponding_nodes:
-                    corresponding_node = corresponding_nodes[0]
-                    target_xpath = target_tree.getpath(corresponding_node)
-                    if debug: print(f"[DEBUG] INFO: Found corresponding node using exact XPath: '{target_xpath}'")
+
+                # Strategy 1: Follow the exact positional path, no XPath needed
+                corresponding_node = _find_by_fingerprint(
+                    target_tree.getroot(), _element_fingerprint(source_node))
+                if corresponding_node is not None:
+                    if debug:
+                        log.debug("Found corresponding node using exact path: '%s'",
+                                  target_tree.getpath(corresponding_node))
                     return corresponding_node
-                
-                if debug: print(f"[DEBUG] INFO: Exact XPath failed, trying alternative strategies...")
-                
+
+                log.debug("Exact path failed, trying alternative strategies...")
+
                 # Strategy 2: Try flexible XPath (remove specific indices)
+                source_xpath = source_doc.getroottree().getpath(source_node)
+                log.debug("Source node XPath: '%s'", source_xpath)
                 simplified_xpath = re.sub(r'\[\d+\]', '', source_xpath)
                 if simplified_xpath != source_xpath:
                     flex_nodes = target_tree.xpath(simplified_xpath)
                     if flex_nodes:
                         target_xpath = target_tree.getpath(flex_nodes[0])
-                        if debug: print(f"[DEBUG] INFO: Found corresponding node using flexible XPath: '{target_xpath}'")
+                        log.debug("Found corresponding node using flexible XPath: '%s'", target_xpath)
                         return flex_nodes[0]
                 
-                if debug: print(f"[DEBUG] WARNING: All mapping strategies failed")
+                log.debug("WARNING: All mapping strategies failed")
                 return None
                     
             except Exception as e:
-                if debug: print(f"[DEBUG] ERROR: Failed to find corresponding node. Error: {e}")
+                log.debug("ERROR: Failed to find corresponding node. Error: %s", e)
                 return None
 
+        def get_ancestor_depths(node):
+            depths = self._ancestor_cache.get(id(node))
+            if depths is None:
+                depths = self._ancestor_cache[id(node)] = _ancestor_depths(node)
+            return depths
+
         def calculate_dom_distance(node1, node2):
             """
             Calculate the DOM distance between two nodes.
             Returns a distance score where lower = closer.
             """
-            try:
-                if node1 is None or node2 is None:
-                    return float('inf')
-                
-                # Get paths to both nodes
-                tree = node1.getroottree()
-                path1 = tree.getpath(node1)
-                path2 = tree.getpath(node2)
-                
-                # Split paths into components
-                parts1 = [p for p in path1.split('/') if p]
-                parts2 = [p for p in path2.split('/') if p]
-                
-                # Find common ancestor length
-                common_length = 0
-                for i in range(min(len(parts1), len(parts2))):
-                    if parts1[i] == parts2[i]:
-                        common_length += 1
-                    else:
-                        break
-                
-                # Distance = steps from common ancestor to node1 + steps to node2
-                distance = (len(parts1) - common_length) + (len(parts2) - common_length)
-                
-                return distance
-                
-            except Exception as e:
-                if debug: print(f"  [DEBUG] Distance calculation failed: {e}")
+            key = (id(node1), id(node2))
+            distance = distance_cache.get(key)
+            if distance is None:
+                distance = distance_cache[key] = _calculate_dom_distance(node1, node2)
+            return distance
+
+        def _calculate_dom_distance(node1, node2):
+            if node1 is None or node2 is None:
                 return float('inf')
+            return _dom_distance(node1, get_ancestor_depths(node2))
 
         def calculate_proximity_score(candidate_node, reference_node, max_distance=10):
             """
@@ -688,6 +1130,21 @@ class ContentExtractor(object):
             score = int(100 * (1 - distance / max_distance))
             return max(0, score)
 
+        def is_date_like_text(text):
+            """All of the date-likeness checks on a candidate's text at once,
+            cheapest first, memoized on the text. Every one of them needs a
+            digit (a day, year or time), so text without one is rejected
+            before any pattern runs.
+            """
+            likely = date_text_cache.get(text)
+            if likely is None:
+                likely = date_text_cache[text] = bool(
+                    _DIGITS_RE.search(text) and (
+                        _YMD_DATE_RE.search(text) or
+                        self.date_finder.contains_month(text) or
+                        is_likely_date_text(text)))
+            return likely
+
         def is_likely_date_text(text):
             """
             STRICT date detection to avoid scoring random text as dates.
@@ -703,158 +1160,108 @@ class ContentExtractor(object):
                 return False
             
             # STRICT PATTERNS: Must match one of these specific patterns
-            strict_patterns = [
-                # Clear date formats with numbers
-                r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',  # 12/31/2025
-                r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',    # 2025/12/31
-                r'\b\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b',
-                r'\b\d{1,2}\s+(يناير|فبراير|مارس|أبريل|مايو|يونيو|يوليو|أغسطس|سبتمبر|أكتوبر|نوفمبر|ديسمبر)\s*,?\s*\d{4}\b',
-                r'\b\d{1,2}\s+(enero|febrero|marzo|abril|mayo|junio|julio|agosto|septiembre|octubre|noviembre|diciembre)\s+\d{4}\b',
-                
-                # Time patterns
-                r'\b([01]?\d|2[0-3]):[0-5]\d\b',       # HH:MM
-                r'\b\d{1,2}:\d{2}\s*(am|pm|ص|م)\b',    # 12:30 PM
-                
-                # Day + Date patterns
-                r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b',
-                r'\b(الاثنين|الثلاثاء|الأربعاء|الخميس|الجمعة|السبت|الأحد)\s*\d{1,2}\s*(يناير|فبراير|مارس|أبريل|مايو|يونيو|يوليو|أغسطس|سبتمبر|أكتوبر|نوفمبر|ديسمبر)\s*,?\s*\d{4}\b',
-                
-                # ISO format dates
-                r'\b\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',
-                
-                # Published/Updated with date
-                r'\b(published|updated|posted|created|تاريخ|نشر|محدث)\s*:?\s*\d',
-            ]
-            
-            # Check strict patterns first
-            for pattern in strict_patterns:
-                if re.search(pattern, text_lower):
-                    return True
+            if _STRICT_DATE_RE.search(text_lower):
+                return True
             
             # RELAXED CHECK: Only if text is short and contains strong date indicators
             if len(text) <= 50:  # Only for short text
                 # Must contain a year
-                if not re.search(r'\b(19|20)\d{2}\b', text):
+                if not _YEAR_RE.search(text):
                     return False
                     
                 # Must contain month or day name
-                date_words = [
-                    # English
-                    'january', 'february', 'march', 'april', 'may', 'june',
-                    'july', 'august', 'september', 'october', 'november', 'december',
-                    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
-                    
-                    # Arabic - be more specific
-                    'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو',
-                    'يوليو', 'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر',
-                    'الاثنين', 'الثلاثاء', 'الأربعاء', 'الخميس', 'الجمعة', 'السبت', 'الأحد',
-                ]
-                
-                has_date_word = any(word in text_lower for word in date_words)
+                has_date_word = _DATE_WORD_RE.search(text_lower) is not None
                 if has_date_word:
                     return True
             
             return False
 
         # Tiers 1 & 2: High-confidence structured data
-        if debug: 
-            print("[DEBUG TIER 1 & 2] Checking URL and Metadata...")
-        date_match = re.search(urls.STRICT_DATE_REGEX, url)
+        log.debug("Tier 1 & 2: Checking URL and Metadata...")
+        # The date needs a year, so URLs without any digit are not scanned
+        date_match = _STRICT_URL_DATE_RE.search(url) if _DIGITS_RE.search(url) else None
         if date_match:
             dt = parse_and_validate(date_match.group(0), from_heuristic=False, from_url=True)
             if dt: 
-                if debug: print(f"[DEBUG] SUCCESS (URL): {dt}")
+                log.debug("SUCCESS (URL): %s", dt)
                 return dt
 
-        # Metadata tags checking...
-        PUBLISH_DATE_TAGS = [
-            {'attribute': 'property', 'value': 'article:published_time'},
-            {'attribute': 'itemprop', 'value': 'datePublished'},
-            {'attribute': 'name', 'value': 'pubdate'},
-            {'attribute': 'pubdate', 'value': 'pubdate'},
-            {'attribute': 'name', 'value': 'published_time'},
-            {'attribute': 'name', 'value': 'publish_date'},
-            {'attribute': 'property', 'value': 'og:published_time'},
-            {'attribute': 'name', 'value': 'date'},
-            {'attribute': 'name', 'value': 'Date'},
-            {'attribute': 'name', 'value': 'DC.date.issued'},
-            {'attribute': 'name', 'value': 'dcterms.created'},
-            {'attribute': 'name', 'value': 'OriginalPublicationDate'},
-            {'attribute': 'name', 'value': 'sailthru.date'},
-            {'attribute': 'name', 'value': 'article_date_original'},
-            {'attribute': 'name', 'value': 'publication_date'},
-            {'attribute': 'name', 'value': 'PublishDate'},
-            {'attribute': 'name', 'value': 'datePublished'},
-            {'attribute': 'property', 'value': 'rnews:datePublished'},
-            {'attribute': 'name', 'value': 'datePublished'},
-            {'attribute': 'span', 'value': 'data-publishdate'},
-            
-        ]
-        for tag_info in PUBLISH_DATE_TAGS:
-            content_key = 'datetime' if tag_info.get('value') == 'datePublished' else 'content'
-            meta_tags = self.parser.getElementsByTag(original_doc, attr=tag_info['attribute'], value=tag_info['value'])
-            if meta_tags:
-                date_content = self.parser.getAttribute(meta_tags[0], content_key)
+        # Metadata tags checking, using a single walk of the document
+        # for every tag in PUBLISH_DATE_TAGS and the <time> tags
+        time_tags = []
+        first_matches = [None] * len(_PUBLISH_DATE_LOOKUPS)
+        for node in self.parser.xpath(original_doc, _PUBLISH_DATE_XPATH):
+            if node.tag == 'time' and node is not original_doc:
+                time_tags.append(node)
+            for i, (attr, value, needle, content_key) in enumerate(_PUBLISH_DATE_LOOKUPS):
+                if first_matches[i] is None and needle in (node.get(attr) or '').translate(_ASCII_LOWER):
+                    first_matches[i] = node
+
+        for (attr, value, needle, content_key), meta_tag in zip(_PUBLISH_DATE_LOOKUPS, first_matches):
+            if meta_tag is not None:
+                date_content = self.parser.getAttribute(meta_tag, content_key)
                 if date_content:
-                    if debug: print(f"  [DEBUG TIER 2] Found meta tag '{tag_info['value']}' with content: '{date_content}'")
+                    log.debug("Tier 2: Found meta tag '%s' with content: '%s'", value, date_content)
                     dt = parse_and_validate(date_content, from_heuristic=False, from_url=False)
                     if dt: 
-                        if debug: print(f"[DEBUG] SUCCESS (Meta): {dt}")
+                        log.debug("SUCCESS (Meta): %s", dt)
                         return dt
 
-        time_tags = self.parser.getElementsByTag(original_doc, tag='time')
         for time_tag in time_tags:
             datetime_attr = self.parser.getAttribute(time_tag, 'datetime')
             if datetime_attr:
-                if debug: print(f"  [DEBUG TIER 2] Found <time> tag with datetime: '{datetime_attr}'")
+                log.debug("Tier 2: Found <time> tag with datetime: '%s'", datetime_attr)
                 dt = parse_and_validate(datetime_attr, from_heuristic=False, from_url=False)
                 if dt: 
-                    if debug: print(f"[DEBUG] SUCCESS (Time Tag): {dt}")
+                    log.debug("SUCCESS (Time Tag): %s", dt)
                     return dt
-        if debug: print("[DEBUG TIER 1 & 2] INFO: No valid date found in URL or metadata.")
+        log.debug("Tier 1 & 2: No valid date found in URL or metadata.")
 
         # Heuristic Tiers with Distance-Based Scoring
-        if debug: print("[DEBUG] INFO: Starting distance-based scoring for all candidates...")
-        
-        PUBLICATION_KEYWORDS = ['published', 'posted', 'created', 'date', 'time', 'updated', 'modified']
+        log.debug("Starting distance-based scoring for all candidates...")
         
         # Map the top_node to target document
         mapped_top_node = None
         if top_node is not None and source_doc is not None:
-            if debug: print(f"[DEBUG] INFO: Mapping top_node from source document to target document...")
+            log.debug("Mapping top_node from source document to target document...")
             mapped_top_node = find_corresponding_node(top_node, source_doc, original_doc)
         
         if mapped_top_node is not None:
-            tree = original_doc.getroottree()
-            top_node_xpath = tree.getpath(mapped_top_node)
-            if debug: print(f"[DEBUG] INFO: Successfully mapped top_node. Reference XPath: '{top_node_xpath}'")
+            if debug:
+                log.debug("Successfully mapped top_node. Reference XPath: '%s'",
+                          original_doc.getroottree().getpath(mapped_top_node))
         else:
-            if debug: print(f"[DEBUG] WARNING: No mapped top_node available; distance scoring disabled.")
+            log.debug("WARNING: No mapped top_node available; distance scoring disabled.")
             
         candidates = []
-        numeric_date_pattern = re.compile(r'\b(19|20)\d{2}[-/.](0[1-9]|1[0-2])[-/.](0[1-9]|[12][0-9]|3[01])\b')
-        
-        # More specific penalty zones - avoid over-penalizing
-        penalty_nodes = self.parser.getElementsByTags(original_doc, tags=['nav', 'aside', 'sidebar', 'footer'])
-        all_tags = self.parser.getElementsByTags(original_doc, tags=['p', 'span', 'div', 'td', 'time'])
         
-        tree = original_doc.getroottree()
+        # More specific penalty zones - avoid over-penalizing. A set, so the
+        # ancestor check below is a hash probe per ancestor. Candidates and
+        # penalty zones are collected in a single walk of the tree.
+        penalty_nodes = set()
+        all_tags = []
+        for node in self.parser.getElementsByTags(original_doc, tags=_DATE_CANDIDATE_TAGS + _PENALTY_TAGS):
+            if node.tag in _PENALTY_TAGS:
+                penalty_nodes.add(node)
+            else:
+                all_tags.append(node)
 
         for tag in all_tags:
-            tag_text = self.parser.getText(tag).strip()
+            # Filter the large containers out before building their text
+            if self.parser.hasMoreTextThan(tag, 200):
+                continue
+            tag_text = self.parser.getText(tag)
             if not tag_text or len(tag_text) < 6 or len(tag_text) > 200: 
                 continue
 
             # STRICT: Only process if it passes strict date detection OR has date-related attributes
-            tag_class = self.parser.getAttribute(tag, 'class') or ''
-            tag_id = self.parser.getAttribute(tag, 'id') or ''
+            # Lowercased once here; every check below is case-insensitive
+            tag_class = (self.parser.getAttribute(tag, 'class') or '').lower()
+            tag_id = (self.parser.getAttribute(tag, 'id') or '').lower()
             
-            has_date_attributes = any(keyword in (tag_class + ' ' + tag_id).lower() 
-                                    for keyword in ['date', 'time', 'publish', 'created', 'updated','data-publishdate'])
+            has_date_attributes = bool(_DATE_ATTR_RE.search(tag_class) or _DATE_ATTR_RE.search(tag_id))
             
-            is_date_like = (self.date_finder.contains_month(tag_text) or 
-                        numeric_date_pattern.search(tag_text) or 
-                        is_likely_date_text(tag_text))
+            is_date_like = is_date_like_text(tag_text)
             
             # Skip unless it's clearly date-related
             if not (is_date_like or has_date_attributes):
@@ -863,14 +1270,14 @@ class ContentExtractor(object):
             # Skip very long text unless it has strong date attributes
             if len(tag_text) > 100 and not has_date_attributes:
                 # Check if it's just a long sentence with an embedded date
-                iso_matches = re.findall(r'\b\d{4}-\d{1,2}-\d{1,2}(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?\b', tag_text)
+                iso_matches = _ISO_EMBED_RE.findall(tag_text)
                 if iso_matches:
                     # Extract just the date part and create a virtual candidate
                     for iso_date in iso_matches:
-                        if debug: print(f"  [DEBUG] Extracting embedded date: '{iso_date}' from long text")
+                        log.debug("Extracting embedded date: '%s' from long text", iso_date)
                         
                         score = 0
-                        debug_info = []
+                        debug_info = [] if debug else None
                         
                         # Give embedded dates moderate proximity scoring
                         if mapped_top_node is not None:
@@ -878,40 +1285,40 @@ class ContentExtractor(object):
                             proximity_score = int(proximity_score * 0.7)  # Reduce slightly for embedded dates
                             if proximity_score > 0:
                                 score += proximity_score
-                                debug_info.append(f"Proximity:+{proximity_score}")
-                            else:
+                                if debug:
+                                    debug_info.append(f"Proximity:+{proximity_score}")
+                            elif debug:
                                 distance = calculate_dom_distance(tag, mapped_top_node)
                                 debug_info.append(f"DistantNode:{distance}")
                         
                         # Bonus for clean ISO format
                         score += 80
-                        debug_info.append("EmbeddedISO:+80")
+                        if debug:
+                            debug_info.append("EmbeddedISO:+80")
                         
-                        candidates.append({
-                            'score': score, 
-                            'text': iso_date, 
-                            'debug': ", ".join(debug_info), 
-                            'tag': tag
-                        })
+                        candidates.append(_Candidate(score, iso_date, ", ".join(debug_info) if debug else '', tag))
                 continue  # Skip processing the long text itself
                 
-            if debug: print(f"  [DEBUG] Processing date candidate: '{tag_text[:60]}...'")
+            log.debug("Processing date candidate: '%s...'", tag_text[:60])
             
             score = 0
-            debug_info = []
+            debug_info = [] if debug else None
 
             # Higher base score for elements with date attributes
             if has_date_attributes:
                 score += 50
-                debug_info.append("DateAttrib:+50")
+                if debug:
+                    debug_info.append("DateAttrib:+50")
 
             # Bonus for shorter, cleaner date strings
             if len(tag_text) <= 30:
                 score += 40
-                debug_info.append("ShortDate:+40")
+                if debug:
+                    debug_info.append("ShortDate:+40")
             elif len(tag_text) <= 50:
                 score += 20
-                debug_info.append("MediumDate:+20")
+                if debug:
+                    debug_info.append("MediumDate:+20")
 
             # Distance-based scoring (reduced weight for non-attribute matches)
             if mapped_top_node is not None:
@@ -923,67 +1330,75 @@ class ContentExtractor(object):
                     
                 if proximity_score > 0:
                     score += proximity_score
-                    debug_info.append(f"Proximity:+{proximity_score}")
-                else:
+                    if debug:
+                        debug_info.append(f"Proximity:+{proximity_score}")
+                elif debug:
                     distance = calculate_dom_distance(tag, mapped_top_node)
                     debug_info.append(f"DistantNode:{distance}")
             
             # Keyword scoring
-            if any(kw in tag_text.lower() for kw in PUBLICATION_KEYWORDS):
+            if _CANDIDATE_PUB_KEYWORD_RE.search(tag_text.lower()):
                 score += 100
-                debug_info.append("PubKwd:+100")
+                if debug:
+                    debug_info.append("PubKwd:+100")
             
             # Class-based scoring 
-            if any(s in tag_class.lower() for s in ['publish', 'timestamp', 'date', 'entry-date', 'post-date','time']):
+            if _DATE_CLASS_RE.search(tag_class):
                 score += 80  # Increased from 60
-                debug_info.append("Class:+80")
+                if debug:
+                    debug_info.append("Class:+80")
 
             # ID-based scoring (highest priority)
-            if any(s in tag_id.lower() for s in ['publish', 'date', 'time', 'created', 'updated']):
+            if _DATE_ID_RE.search(tag_id):
                 score += 120  # Increased from 80
-                debug_info.append("ID:+120")
+                if debug:
+                    debug_info.append("ID:+120")
 
             # Bonus for time elements
             if tag.tag == 'time':
                 score += 60
-                debug_info.append("TimeTag:+60")
+                if debug:
+                    debug_info.append("TimeTag:+60")
 
             # IMPROVED: Less aggressive penalty zone
-            in_penalty_zone = False
-            parent = self.parser.getParent(tag)
-            while parent is not None:
-                if parent in penalty_nodes: 
-                    in_penalty_zone = True
-                    break
-                parent = self.parser.getParent(parent)
+            in_penalty_zone = not penalty_nodes.isdisjoint(tag.iterancestors())
             if in_penalty_zone:
                 score -= 20  # Further reduced penalty
-                debug_info.append("PenaltyZone:-20")
+                if debug:
+                    debug_info.append("PenaltyZone:-20")
             
-            candidates.append({'score': score, 'text': tag_text, 'debug': ", ".join(debug_info), 'tag': tag})
+            candidates.append(_Candidate(score, tag_text, ", ".join(debug_info) if debug else '', tag))
 
         if not candidates:
-            if debug: print("[DEBUG] FAILED: No suitable date candidates found.")
+            log.debug("FAILED: No suitable date candidates found.")
             return None
 
-        candidates.sort(key=lambda x: x['score'], reverse=True)
-
-        if debug: print(f"[DEBUG] INFO: Found {len(candidates)} date candidates. Top 10:")
-        for i, cand in enumerate(candidates[:10]):
-            if debug: print(f"  {i+1}. Score: {cand['score']:.1f}, Text: '{cand['text'][:50]}...', ({cand['debug']})")
+        # The same date text in several tags parses the same way, so only
+        # its best-scored copy (the first one, on a tie) is worth trying
+        best_by_text = {}
+        for candidate in candidates:
+            best = best_by_text.get(candidate.text)
+            if best is None or candidate.score > best.score:
+                best_by_text[candidate.text] = candidate
+        candidates = [c for c in candidates if best_by_text[c.text] is c]
+
+        if debug:
+            log.debug("Found %s date candidates. Top 10:", len(candidates))
+            for i, cand in enumerate(heapq.nlargest(10, candidates, key=_by_score)):
+                log.debug("%s. Score: %.1f, Text: '%s...', (%s)", i+1, cand.score, cand.text[:50], cand.debug)
         
         # Try candidates with positive scores first, then others
-        for candidate in candidates:
-            if candidate['score'] < -30:  # Skip heavily penalized candidates only
-                if debug: print(f"  [DEBUG] Skipping heavily penalized candidate: {candidate['text'][:30]}... (Score: {candidate['score']})")
+        for candidate in _iter_by_score(candidates):
+            if candidate.score < -30:  # Skip heavily penalized candidates only
+                log.debug("Skipping heavily penalized candidate: %s... (Score: %s)", candidate.text[:30], candidate.score)
                 continue
                 
-            datetime_obj = parse_and_validate(candidate['text'], from_heuristic=True, from_url=False)
+            datetime_obj = parse_and_validate(candidate.text, from_heuristic=True, from_url=False)
             if datetime_obj:
-                if debug: print(f"[DEBUG] SUCCESS: Best candidate '{candidate['text'][:50]}...' (Score: {candidate['score']:.1f}) → {datetime_obj}")
+                log.debug("SUCCESS: Best candidate '%s...' (Score: %.1f) → %s", candidate.text[:50], candidate.score, datetime_obj)
                 return datetime_obj
 
-        if debug: print("[DEBUG] --- All tiers failed. Returning None. ---")
+        log.debug("--- All tiers failed. Returning None. ---")
         return None
     
     def get_title(self, original_doc, cleaned_doc, top_node=None, debug=False):
@@ -998,25 +1413,11 @@ class ContentExtractor(object):
         def find_corresponding_node(source_node, source_doc_tree, target_doc_tree):
             if source_node is None: return None
             try:
-                source_xpath = source_doc_tree.getpath(source_node)
-                target_nodes = target_doc_tree.xpath(source_xpath)
-                return target_nodes[0] if target_nodes else None
+                return _find_by_fingerprint(target_doc_tree.getroot(), _element_fingerprint(source_node))
             except Exception as e:
                 if debug: print(f"  [DEBUG] Node mapping failed: {e}")
                 return None
 
-        def calculate_dom_distance(node1, node2, tree):
-            if node1 is None or node2 is None: return float('inf')
-            try:
-                path1 = tree.getpath(node1).split('/')
-                path2 = tree.getpath(node2).split('/')
-                common_len = 0
-                for i in range(min(len(path1), len(path2))):
-                    if path1[i] == path2[i]: common_len += 1
-                    else: break
-                return (len(path1) - common_len) + (len(path2) - common_len)
-            except: return float('inf')
-
         # 1. Get baseline candidates from metadata
         title_element = self.parser.getElementsByTag(original_doc, tag='title')
         title_text = self.parser.getText(title_element[0]) if title_element else ""
@@ -1025,69 +1426,83 @@ class ContentExtractor(object):
 
         # 2. Intelligent Heuristic Search
         candidates = []
-        potential_tags = self.parser.getElementsByTags(original_doc, tags=['h1', 'h2', 'h3', 'p'])
-        
-        penalty_tags = ['nav', 'aside', 'sidebar', 'footer']
+        potential_tags = []
+        penalty_nodes = set()
+        for node in self.parser.getElementsByTags(original_doc, tags=_TITLE_CANDIDATE_TAGS + _PENALTY_TAGS):
+            if node.tag in _PENALTY_TAGS:
+                penalty_nodes.add(node)
+            else:
+                potential_tags.append(node)
+
         penalty_selectors = ['.related-posts', '.comments', '.e-loop-item', '.post-navigation']
-        penalty_nodes = self.parser.getElementsByTags(original_doc, tags=penalty_tags)
         for selector in penalty_selectors:
-            penalty_nodes.extend(self.parser.css_select(original_doc, selector))
+            penalty_nodes.update(self.parser.css_select(original_doc, selector))
 
         original_doc_tree = original_doc.getroottree()
         mapped_top_node = find_corresponding_node(top_node, cleaned_doc.getroottree(), original_doc_tree)
         if debug and mapped_top_node is not None:
              print("[DEBUG] INFO: Mapped top_node to original doc for location scoring.")
+        # Ancestors of the reference node, walked once for all candidates
+        top_node_depths = _ancestor_depths(mapped_top_node) if mapped_top_node is not None else None
 
         for tag in potential_tags:
-            tag_text = self.parser.getText(tag).strip()
+            if self.parser.hasMoreTextThan(tag, 250): continue
+            tag_text = self.parser.getText(tag)
             if not tag_text or len(tag_text) < 15 or len(tag_text) > 250: continue
 
             score = 0
-            debug_info = []
+            debug_info = [] if debug else None
 
             # Tag Type Score
-            if tag.tag == 'h1': score += 100; debug_info.append("H1:+100")
-            elif tag.tag == 'h2': score += 30; debug_info.append("H2:+30")
+            if tag.tag == 'h1':
+                score += 100
+                if debug: debug_info.append("H1:+100")
+            elif tag.tag == 'h2':
+                score += 30
+                if debug: debug_info.append("H2:+30")
             
             # Attribute Score
             tag_class_id = ((self.parser.getAttribute(tag, 'class') or '') + ' ' + (self.parser.getAttribute(tag, 'id') or '')).lower()
-            if any(s in tag_class_id for s in ['title', 'headline', 'heading']):
-                score += 85; debug_info.append("Attr:+85")
+            if _TITLE_ATTR_RE.search(tag_class_id):
+                score += 85
+                if debug: debug_info.append("Attr:+85")
 
             # Location Score (Proximity to main content)
-            distance = calculate_dom_distance(tag, mapped_top_node, original_doc_tree)
-            is_in_top_node = (mapped_top_node is not None and (tag == mapped_top_node or tag in mapped_top_node.iterdescendants()))
+            distance = _dom_distance(tag, top_node_depths) if top_node_depths is not None else float('inf')
+            # Walks up from the tag rather than through the whole top node
+            is_in_top_node = (mapped_top_node is not None and (tag == mapped_top_node or mapped_top_node in tag.iterancestors()))
 
             if is_in_top_node:
-                score += 50; debug_info.append("InTopNode:+50")
+                score += 50
+                if debug: debug_info.append("InTopNode:+50")
             # CRITICAL ADDITION: Sibling Proximity Bonus
             elif distance <= 4: # If it's a very close sibling/cousin
-                score += 80; debug_info.append(f"SiblingProx:{distance}:+80")
+                score += 80
+                if debug: debug_info.append(f"SiblingProx:{distance}:+80")
             
             # Paragraph Penalty
             if tag.tag == 'p':
                  if any(p in tag_text for p in ['.', '?', '!', ':', '»']) or len(tag_text.split()) > 25:
-                    score -= 50; debug_info.append("IsPara:-50")
+                    score -= 50
+                    if debug: debug_info.append("IsPara:-50")
             
             # Penalty Zone
-            in_penalty_zone = False
-            parent = tag
-            while parent is not None:
-                if parent in penalty_nodes: in_penalty_zone = True; break
-                parent = self.parser.getParent(parent)
-            if in_penalty_zone: score -= 100; debug_info.append("PenaltyZone:-100")
+            in_penalty_zone = tag in penalty_nodes or not penalty_nodes.isdisjoint(tag.iterancestors())
+            if in_penalty_zone:
+                score -= 100
+                if debug: debug_info.append("PenaltyZone:-100")
             
-            candidates.append({'score': score, 'text': tag_text, 'debug': ", ".join(debug_info)})
+            candidates.append(_Candidate(score, tag_text, ", ".join(debug_info) if debug else ''))
 
         title_h_candidate = ""
         if candidates:
-            candidates.sort(key=lambda x: x['score'], reverse=True)
             if debug:
                 print(f"[DEBUG] INFO: Found {len(candidates)} title candidates. Top 5:")
-                for cand in candidates[:5]: print(f"  - Score: {cand['score']:.1f}, Text: '{cand['text']}', ({cand['debug']})")
+                for cand in heapq.nlargest(5, candidates, key=_by_score): print(f"  - Score: {cand.score:.1f}, Text: '{cand.text}', ({cand.debug})")
             # Use a quality threshold to ensure we don't pick a low-scoring candidate
-            if candidates[0]['score'] > 70:
-                title_h_candidate = candidates[0]['text']
+            best_candidate = max(candidates, key=_by_score)
+            if best_candidate.score > 70:
+                title_h_candidate = best_candidate.text
         
         # 3. Final Comparison of all sources
         options = [
@@ -1155,16 +1570,16 @@ class ContentExtractor(object):
         """
         total_feed_urls = []
         for category in categories:
-            kwargs = {'attr': 'type', 'value': r'application\/rss\+xml'}
-            feed_elements = self.parser.getElementsByTag(
-                category.doc, **kwargs)
+            feed_elements = self.parser.xpath(category.doc, _FEED_XPATH)
             feed_urls = [e.get('href') for e in feed_elements if e.get('href')]
             total_feed_urls.extend(feed_urls)
 
-        total_feed_urls = total_feed_urls[:50]
+        # Dedupe before normalizing, so each distinct link is prepared once;
+        # dict.fromkeys keeps the page order, unlike set()
+        total_feed_urls = list(dict.fromkeys(total_feed_urls))[:50]
         total_feed_urls = [urls.prepare_url(f, source_url)
                            for f in total_feed_urls]
-        total_feed_urls = list(set(total_feed_urls))
+        total_feed_urls = list(dict.fromkeys(total_feed_urls))
         return total_feed_urls
 
     def get_favicon(self, doc):
@@ -1172,8 +1587,7 @@ class ContentExtractor(object):
         <link rel="shortcut icon" type="image/png" href="favicon.png" />
         <link rel="icon" type="image/png" href="favicon.png" />
         """
-        kwargs = {'tag': 'link', 'attr': 'rel', 'value': 'icon'}
-        meta = self.parser.getElementsByTag(doc, **kwargs)
+        meta = self.parser.xpath(doc, _FAVICON_XPATH)
         if meta:
             favicon = self.parser.getAttribute(meta[0], 'href')
             return favicon
@@ -1268,8 +1682,9 @@ class ContentExtractor(object):
         data = defaultdict(dict)
         properties = self.parser.css_select(doc, 'meta')
         for prop in properties:
-            key = prop.attrib.get('property') or prop.attrib.get('name')
-            value = prop.attrib.get('content') or prop.attrib.get('value')
+            attrib = prop.attrib
+            key = attrib.get('property') or attrib.get('name')
+            value = attrib.get('content') or attrib.get('value')
 
             if not key or not value:
                 continue
@@ -1282,25 +1697,23 @@ class ContentExtractor(object):
                 data[key] = value
                 continue
 
-            key = key.split(':')
-            key_head = key.pop(0)
+            key_head, *parts = key.split(':')
             ref = data[key_head]
 
-            if isinstance(ref, str) or isinstance(ref, int):
-                data[key_head] = {key_head: ref}
-                ref = data[key_head]
+            if isinstance(ref, (str, int)):
+                ref = data[key_head] = {key_head: ref}
 
-            for idx, part in enumerate(key):
-                if idx == len(key) - 1:
-                    ref[part] = value
-                    break
-                if not ref.get(part):
-                    ref[part] = dict()
-                elif isinstance(ref.get(part), str) or isinstance(ref.get(part), int):
+            last = parts.pop()
+            for part in parts:
+                child = ref.get(part)
+                if not child:
+                    child = ref[part] = {}
+                elif isinstance(child, (str, int)):
                     # Not clear what to do in this scenario,
                     # it's not always a URL, but an ID of some sort
-                    ref[part] = {'identifier': ref[part]}
-                ref = ref[part]
+                    child = ref[part] = {'identifier': child}
+                ref = child
+            ref[last] = value
         return data
 
     def get_canonical_link(self, article_url, doc):
@@ -1311,8 +1724,7 @@ class ContentExtractor(object):
         1. The rel=canonical tag
         2. The og:url tag
         """
-        links = self.parser.getElementsByTag(doc, tag='link', attr='rel',
-                                             value='canonical')
+        links = self.parser.xpath(doc, _CANONICAL_XPATH)
 
         canonical = self.parser.getAttribute(links[0], 'href') if links else ''
         og_url = self.get_meta_content(doc, 'meta[property="og:url"]')
@@ -1325,10 +1737,8 @@ class ContentExtractor(object):
                 # parsed_url.path might be 'example.com/article.html' where
                 # clearly example.com is the hostname
                 parsed_article_url = urlparse(article_url)
-                strip_hostname_in_meta_path = re. \
-                    match(".*{}(?=/)/(.*)".
-                          format(parsed_article_url.hostname),
-                          parsed_meta_url.path)
+                strip_hostname_in_meta_path = _meta_path_hostname_re(
+                    parsed_article_url.hostname).match(parsed_meta_url.path)
                 try:
                     true_path = strip_hostname_in_meta_path.group(1)
                 except AttributeError:
@@ -1344,12 +1754,14 @@ class ContentExtractor(object):
     def get_img_urls(self, article_url, doc):
         """Return all of the images on an html page, lxml root
         """
-        img_kwargs = {'tag': 'img'}
-        img_tags = self.parser.getElementsByTag(doc, **img_kwargs)
-        urls = [img_tag.get('src')
-                for img_tag in img_tags if img_tag.get('src')]
-        img_links = set([urljoin(article_url, url)
-                         for url in urls])
+        # Streams the <img> tags below doc (the root itself never counts,
+        # as with getElementsByTag) straight into the set
+        base_split = urlsplit(article_url or '')
+        img_links = set()
+        for img_tag in doc.iterdescendants('img'):
+            src = img_tag.get('src')
+            if src:
+                img_links.add(_fast_urljoin(article_url, base_split, src))
         return img_links
 
     def get_first_img_url(self, article_url, top_node):
@@ -1360,7 +1772,8 @@ class ContentExtractor(object):
         node_images = self.get_img_urls(article_url, top_node)
         node_images = list(node_images)
         if node_images:
-            return urljoin(article_url, node_images[0])
+            return _fast_urljoin(
+                article_url, urlsplit(article_url or ''), node_images[0])
         return ''
 
     def _get_urls(self, doc, titles):
@@ -1388,14 +1801,15 @@ class ContentExtractor(object):
             return []
         # If we are extracting from raw text
         if regex:
-            doc_or_html = re.sub('<[^<]+?>', ' ', str(doc_or_html))
-            doc_or_html = re.findall(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|'
-            r'(?:%[0-9a-fA-F][0-9a-fA-F]))+', doc_or_html)
+            doc_or_html = _HTML_TAG_RE.sub(' ', str(doc_or_html))
+            doc_or_html = _URL_FINDALL_RE.findall(doc_or_html)
             doc_or_html = [i.strip() for i in doc_or_html]
             return doc_or_html or []
         # If the doc_or_html is html, parse it into a root
         if isinstance(doc_or_html, str):
+            if not titles:
+                # Only the hrefs are needed, no need to build the tree
+                return self.parser.getHrefsFromString(doc_or_html)
             doc = self.parser.fromstring(doc_or_html)
         else:
             doc = doc_or_html
@@ -1408,11 +1822,14 @@ class ContentExtractor(object):
         cnn.com --> [cnn.com/latest, world.cnn.com, cnn.com/asia]
         """
         page_urls = self.get_urls(doc)
-        valid_categories = []
+        domain_tld = _cached_tldextract(source_url)
+        # Insertion ordered set, pages link the same categories many times
+        valid_categories = {}
         for p_url in page_urls:
-            scheme = urls.get_scheme(p_url, allow_fragments=False)
-            domain = urls.get_domain(p_url, allow_fragments=False)
-            path = urls.get_path(p_url, allow_fragments=False)
+            parsed_url = _cached_urlparse(p_url, allow_fragments=False)
+            scheme = parsed_url.scheme
+            domain = parsed_url.netloc
+            path = parsed_url.path
 
             if not domain and not path:
                 if self.config.verbose:
@@ -1430,8 +1847,7 @@ class ContentExtractor(object):
                 continue
 
             if domain:
-                child_tld = tldextract.extract(p_url)
-                domain_tld = tldextract.extract(source_url)
+                child_tld = _cached_tldextract(p_url)
                 child_subdomain_parts = child_tld.subdomain.split('.')
                 subdomain_contains = False
                 for part in child_subdomain_parts:
@@ -1456,7 +1872,7 @@ class ContentExtractor(object):
                                'subdomain' % p_url))
                     continue
                 else:
-                    valid_categories.append(scheme + '://' + domain)
+                    valid_categories[scheme + '://' + domain] = None
                     # TODO account for case where category is in form
                     # http://subdomain.domain.tld/category/ <-- still legal!
             else:
@@ -1467,60 +1883,26 @@ class ContentExtractor(object):
                     path_chunks.remove('index.html')
 
                 if len(path_chunks) == 1 and len(path_chunks[0]) < 14:
-                    valid_categories.append(domain + path)
+                    valid_categories[domain + path] = None
                 else:
                     if self.config.verbose:
                         print(('elim category url %s for >1 path chunks '
                                'or size path chunks' % p_url))
-        stopwords = [
-            'about', 'help', 'privacy', 'legal', 'feedback', 'sitemap',
-            'profile', 'account', 'mobile', 'sitemap', 'facebook', 'myspace',
-            'twitter', 'linkedin', 'bebo', 'friendster', 'stumbleupon',
-            'youtube', 'vimeo', 'store', 'mail', 'preferences', 'maps',
-            'password', 'imgur', 'flickr', 'search', 'subscription', 'itunes',
-            'siteindex', 'events', 'stop', 'jobs', 'careers', 'newsletter',
-            'subscribe', 'academy', 'shopping', 'purchase', 'site-map',
-            'shop', 'donate', 'newsletter', 'product', 'advert', 'info',
-            'tickets', 'coupons', 'forum', 'board', 'archive', 'browse',
-            'howto', 'how to', 'faq', 'terms', 'charts', 'services',
-            'contact', 'plus', 'admin', 'login', 'signup', 'register',
-            'developer', 'proxy']
-
-        _valid_categories = []
-
-        # TODO Stop spamming urlparse and tldextract calls...
+        # Stopword filtering, scheme fixing and deduping in a single pass
+        _valid_categories = set()
 
         for p_url in valid_categories:
-            path = urls.get_path(p_url)
-            subdomain = tldextract.extract(p_url).subdomain
+            path = _cached_urlparse(p_url).path
+            subdomain = _cached_tldextract(p_url).subdomain
             conjunction = path + ' ' + subdomain
-            bad = False
-            for badword in stopwords:
-                if badword.lower() in conjunction.lower():
-                    if self.config.verbose:
-                        print(('elim category url %s for subdomain '
-                               'contain stopword!' % p_url))
-                    bad = True
-                    break
-            if not bad:
-                _valid_categories.append(p_url)
-
-        _valid_categories.append('/')  # add the root
-
-        for i, p_url in enumerate(_valid_categories):
-            if p_url.startswith('://'):
-                p_url = 'http' + p_url
-                _valid_categories[i] = p_url
-
-            elif p_url.startswith('//'):
-                p_url = 'http:' + p_url
-                _valid_categories[i] = p_url
-
-            if p_url.endswith('/'):
-                p_url = p_url[:-1]
-                _valid_categories[i] = p_url
+            if _CATEGORY_STOPWORD_RE.search(conjunction.lower()):
+                if self.config.verbose:
+                    print(('elim category url %s for subdomain '
+                           'contain stopword!' % p_url))
+                continue
+            _valid_categories.add(_complete_category_url(p_url))
 
-        _valid_categories = list(set(_valid_categories))
+        _valid_categories.add(_complete_category_url('/'))  # add the root
 
         category_urls = [urls.prepare_url(p_url, source_url)
                          for p_url in _valid_categories]
@@ -1551,22 +1933,26 @@ class ContentExtractor(object):
         starting_boost = float(1.0)
         cnt = 0
         i = 0
-        parent_nodes = []
         nodes_with_text = []
+        # Running gravityScore/gravityNodes of the scored parents, in the
+        # order they were first scored. lxml elements hash by identity, as
+        # they compare
+        gravity_scores = {}
+        gravity_nodes = {}
+        self._stopword_counts = {}
 
         for node in nodes_to_check:
             text_node = self.parser.getText(node)
-            word_stats = self.stopwords_class(language=self.language). \
-                get_stopword_count(text_node)
-            high_link_density = self.is_highlink_density(node)
-            if word_stats.get_stopword_count() > 2 and not high_link_density:
-                nodes_with_text.append(node)
+            stopword_count = self._count_stopwords(text_node)
+            # Kept with the node so the scoring pass does not redo it
+            if stopword_count > 2 and not self.is_highlink_density(node):
+                nodes_with_text.append((node, stopword_count))
 
         nodes_number = len(nodes_with_text)
         negative_scoring = 0
         bottom_negativescore_nodes = float(nodes_number) * 0.25
 
-        for node in nodes_with_text:
+        for node, stopword_count in nodes_with_text:
             boost_score = float(0)
             # boost
             if self.is_boostable(node):
@@ -1583,40 +1969,57 @@ class ContentExtractor(object):
                     if negscore > 40:
                         boost_score = float(5)
 
-            text_node = self.parser.getText(node)
-            word_stats = self.stopwords_class(language=self.language). \
-                get_stopword_count(text_node)
-            upscore = int(word_stats.get_stopword_count() + boost_score)
+            upscore = int(stopword_count + boost_score)
 
-            parent_node = self.parser.getParent(node)
-            self.update_score(parent_node, upscore)
-            self.update_node_count(parent_node, 1)
-
-            if parent_node not in parent_nodes:
-                parent_nodes.append(parent_node)
+            parent_node = node.getparent()
+            score = gravity_scores.get(parent_node)
+            if score is None:
+                score, count = self._get_gravity(parent_node)
+            else:
+                # The attribute used to be read back as a float
+                score, count = float(score), gravity_nodes[parent_node]
+            gravity_scores[parent_node] = score + upscore
+            gravity_nodes[parent_node] = count + 1
 
             # Parent of parent node
-            parent_parent_node = self.parser.getParent(parent_node)
+            parent_parent_node = parent_node.getparent()
             if parent_parent_node is not None:
-                self.update_node_count(parent_parent_node, 1)
-                self.update_score(parent_parent_node, upscore / 2)
-                if parent_parent_node not in parent_nodes:
-                    parent_nodes.append(parent_parent_node)
+                score = gravity_scores.get(parent_parent_node)
+                if score is None:
+                    score, count = self._get_gravity(parent_parent_node)
+                else:
+                    score = float(score)
+                    count = gravity_nodes[parent_parent_node]
+                gravity_scores[parent_parent_node] = score + upscore / 2
+                gravity_nodes[parent_parent_node] = count + 1
             cnt += 1
             i += 1
 
         top_node_score = 0
-        for e in parent_nodes:
-            score = self.get_score(e)
-
+        for e, score in gravity_scores.items():
             if score > top_node_score:
                 top_node = e
                 top_node_score = score
 
             if top_node is None:
                 top_node = e
+
+        # The output formatter reads the scores back off the nodes
+        for e, score in gravity_scores.items():
+            self.parser.setAttribute(e, "gravityScore", str(score))
+        for e, count in gravity_nodes.items():
+            self.parser.setAttribute(e, "gravityNodes", str(count))
         return top_node
 
+    def _get_gravity(self, node):
+        """The gravityScore and gravityNodes a node starts out with, as
+        update_score and update_node_count read them
+        """
+        score_string = self.parser.getAttribute(node, 'gravityScore')
+        count_string = self.parser.getAttribute(node, 'gravityNodes')
+        return (float(score_string) if score_string else 0,
+                int(count_string) if count_string else 0)
+
     def is_boostable(self, node):
         """A lot of times the first paragraph might be the caption under an image
         so we'll want to make sure if we're going to boost a parent node that
@@ -1632,29 +2035,34 @@ class ContentExtractor(object):
         nodes = self.walk_siblings(node)
         for current_node in nodes:
             # <p>
-            current_node_tag = self.parser.getTag(current_node)
+            current_node_tag = current_node.tag
             if current_node_tag == para:
                 if steps_away >= max_stepsaway_from_node:
                     return False
                 paragraph_text = self.parser.getText(current_node)
-                word_stats = self.stopwords_class(language=self.language). \
-                    get_stopword_count(paragraph_text)
-                if word_stats.get_stopword_count() > minimum_stopword_count:
+                if self._count_stopwords(paragraph_text) > \
+                        minimum_stopword_count:
                     return True
                 steps_away += 1
         return False
 
     def walk_siblings(self, node):
-        return self.parser.previousSiblings(node)
+        """Previous siblings of node, nearest first. Yielded lazily, as
+        is_boostable mostly stops after a few of them
+        """
+        return self.parser.iterPreviousSiblings(node)
 
     def add_siblings(self, top_node):
         baseline_score_siblings_para = self.get_siblings_score(top_node)
         results = self.walk_siblings(top_node)
+        # Every paragraph used to be inserted in front of the ones before
+        # it, they are all put in place at once instead.
+        siblings_content = []
         for current_node in results:
-            ps = self.get_siblings_content(
-                current_node, baseline_score_siblings_para)
-            for p in ps:
-                top_node.insert(0, p)
+            siblings_content.extend(self.get_siblings_content(
+                current_node, baseline_score_siblings_para))
+        siblings_content.reverse()
+        top_node[:0] = siblings_content
         return top_node
 
     def get_siblings_content(
@@ -1678,10 +2086,7 @@ class ContentExtractor(object):
                 for first_paragraph in potential_paragraphs:
                     text = self.parser.getText(first_paragraph)
                     if len(text) > 0:
-                        word_stats = self.stopwords_class(
-                            language=self.language). \
-                            get_stopword_count(text)
-                        paragraph_score = word_stats.get_stopword_count()
+                        paragraph_score = self._count_stopwords(text)
                         sibling_baseline_score = float(.30)
                         high_link_density = self.is_highlink_density(
                             first_paragraph)
@@ -1709,12 +2114,10 @@ class ContentExtractor(object):
 
         for node in nodes_to_check:
             text_node = self.parser.getText(node)
-            word_stats = self.stopwords_class(language=self.language). \
-                get_stopword_count(text_node)
-            high_link_density = self.is_highlink_density(node)
-            if word_stats.get_stopword_count() > 2 and not high_link_density:
+            stopword_count = self._count_stopwords(text_node)
+            if stopword_count > 2 and not self.is_highlink_density(node):
                 paragraphs_number += 1
-                paragraphs_score += word_stats.get_stopword_count()
+                paragraphs_score += stopword_count
 
         if paragraphs_number > 0:
             base = paragraphs_score / paragraphs_number
@@ -1749,29 +2152,31 @@ class ContentExtractor(object):
         """Checks the density of links within a node, if there is a high
         link to text ratio, then the text is less likely to be relevant
         """
-        links = self.parser.getElementsByTag(e, tag='a')
-        if not links:
+        # Most paragraphs hold no link at all, which needs no list of them
+        if next(e.iterdescendants('a'), None) is None:
             return False
+        links = self.parser.getElementsByTag(e, tag='a')
 
-        text = self.parser.getText(e)
-        words = [word for word in text.split() if word.isalnum()]
-        if not words:
+        # Counts the alphanumeric words without building a list of them
+        words_number = sum(map(str.isalnum, self.parser.getTextWords(e)))
+        if not words_number:
             return True
-        words_number = float(len(words))
-        sb = []
+
+        # The link texts used to be joined without a separator, so the
+        # last word of a link and the first of the next one counted once
+        num_link_words = 0
+        texts_number = 0
         for link in links:
-            sb.append(self.parser.getText(link))
-
-        link_text = ''.join(sb)
-        link_words = link_text.split()
-        num_link_words = float(len(link_words))
-        num_links = float(len(links))
-        link_divisor = float(num_link_words / words_number)
-        score = float(link_divisor * num_links)
-        if score >= 1.0:
-            return True
-        return False
-        # return True if score > 1.0 else False
+            link_words_number = len(self.parser.getTextWords(link))
+            if link_words_number:
+                num_link_words += link_words_number
+                texts_number += 1
+        if texts_number:
+            num_link_words -= texts_number - 1
+        # The counts stay ints, true division rounds as the old float()
+        # conversions did
+        score = num_link_words / words_number * len(links)
+        return score >= 1.0
 
     def get_score(self, node):
         """Returns the gravityScore as an integer from this node
@@ -1821,7 +2226,7 @@ class ContentExtractor(object):
         """
         node = self.add_siblings(top_node)
         for e in self.parser.getChildren(node):
-            e_tag = self.parser.getTag(e)
+            e_tag = e.tag
             if e_tag != 'p':
                 if self.is_highlink_density(e):
                     self.parser.remove(e)
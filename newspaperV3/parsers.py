@@ -7,6 +7,7 @@ Parser objects will only contain operations that manipulate
 or query an lxml or soup dom object generated from an article's html.
 """
 import logging
+import lxml.cssselect
 import lxml.etree
 import lxml.html
 import lxml.html.clean
@@ -21,9 +22,102 @@ from . import text
 
 log = logging.getLogger(__name__)
 
+# What lxml.html.fromstring takes for a whole document rather than a fragment
+_FULL_HTML_RE = re.compile(r'^\s*<(?:html|!doctype)', re.I)
+
+
+class _HrefCollector(object):
+    """lxml parser target keeping the href of every <a>, and enough of the
+    document's layout to tell the root lxml.html.fromstring would pick
+    """
+
+    def __init__(self):
+        self.hrefs = []
+        # The same hrefs split by where they sit around the body
+        self.body_hrefs = []
+        self.before_body_hrefs = []
+        self.after_body_hrefs = []
+        self.has_head = False
+        self.has_body = False
+        self.in_body = False
+        self.depth = 0
+        self.body_children = 0
+        self.body_has_text = False
+        # Index in body_hrefs of the body's first child, when that is an <a>
+        self.first_child_href = None
+        # libxml2 can report more markup once the root is closed, which
+        # the tree builders leave out of the document
+        self.closed = False
+
+    def start(self, tag, attrib):
+        if self.closed:
+            return
+        href = attrib.get('href') if tag == 'a' else None
+        if self.in_body:
+            if self.depth == 2:
+                self.body_children += 1
+                if self.body_children == 1 and href:
+                    self.first_child_href = len(self.body_hrefs)
+            if href:
+                self.body_hrefs.append(href)
+        elif href:
+            if self.has_body:
+                self.after_body_hrefs.append(href)
+            else:
+                self.before_body_hrefs.append(href)
+        elif self.depth == 1 and tag == 'head':
+            self.has_head = True
+        elif self.depth == 1 and tag == 'body':
+            # fromstring merges any further bodies into the first one
+            self.has_body = self.in_body = True
+        if href:
+            self.hrefs.append(href)
+        self.depth += 1
+
+    def end(self, tag):
+        if self.closed:
+            return
+        self.depth -= 1
+        if self.depth == 1:
+            self.in_body = False
+        elif self.depth == 0:
+            self.closed = True
+
+    def data(self, data):
+        if self.in_body and self.depth == 2 and data.strip():
+            self.body_has_text = True
+
+    def comment(self, text):
+        if self.in_body and self.depth == 2:
+            self.body_children += 1
+
+    def pi(self, target, data=None):
+        self.comment(data)
+
+    def close(self):
+        return self
+
 
 class Parser(object):
 
+    _compiled_xpaths = {}
+    _compiled_css_selectors = {}
+
+    @classmethod
+    def xpath(cls, node, expression):
+        """Evaluates `expression` on `node`, compiling each distinct
+        expression only once
+        """
+        if not isinstance(node.tag, str):
+            # Compiled expressions take no comments or processing
+            # instructions, which the plain node.xpath call accepts
+            return node.xpath(expression)
+        compiled = cls._compiled_xpaths.get(expression)
+        if compiled is None:
+            compiled = lxml.etree.XPath(expression)
+            cls._compiled_xpaths[expression] = compiled
+        return compiled(node)
+
     @classmethod
     def xpath_re(cls, node, expression):
         regexp_namespace = "http://exslt.org/regular-expressions"
@@ -40,7 +134,16 @@ class Parser(object):
 
     @classmethod
     def css_select(cls, node, selector):
-        return node.cssselect(selector)
+        """Same as `node.cssselect(selector)`, but each distinct selector is
+        translated to XPath and compiled only once
+        """
+        translator = 'html' if isinstance(node, lxml.html.HtmlMixin) else 'xml'
+        key = (selector, translator)
+        compiled = cls._compiled_css_selectors.get(key)
+        if compiled is None:
+            compiled = lxml.cssselect.CSSSelector(selector, translator=translator)
+            cls._compiled_css_selectors[key] = compiled
+        return compiled(node)
 
     @classmethod
     def get_unicode_html(cls, html):
@@ -71,6 +174,36 @@ class Parser(object):
             log.warn('fromstring() returned an invalid string: %s...', html[:20])
             return
 
+    @classmethod
+    def getHrefsFromString(cls, html):
+        """The href of every <a> getElementsByTag(fromstring(html), tag='a')
+        finds, streamed from the parser without building the tree
+        """
+        html = cls.get_unicode_html(html)
+        try:
+            if html.startswith('<?'):
+                html = re.sub(r'^\<\?.*?\?\>', '', html, flags=re.DOTALL)
+            links = lxml.etree.fromstring(
+                html, lxml.etree.HTMLParser(target=_HrefCollector()))
+        except Exception:
+            log.warn('fromstring() returned an invalid string: %s...', html[:20])
+            return []
+        if _FULL_HTML_RE.match(html) or not links.has_body:
+            # fromstring keeps the whole document
+            return links.hrefs
+        if links.has_head:
+            # Same, but with every body merged into the first one
+            return (links.before_body_hrefs + links.body_hrefs +
+                    links.after_body_hrefs)
+        # Otherwise a fragment was passed in, and fromstring only keeps the
+        # body. A lone element in it becomes the root, which
+        # getElementsByTag leaves out
+        hrefs = links.body_hrefs
+        if (links.first_child_href is not None
+                and links.body_children == 1 and not links.body_has_text):
+            del hrefs[links.first_child_href]
+        return hrefs
+
     @classmethod
     def clean_article_html(cls, node):
         article_cleaner = lxml.html.clean.Cleaner()
@@ -120,11 +253,14 @@ class Parser(object):
             else:
                 trans = 'translate(@%s, "%s", "%s")' % (attr, string.ascii_uppercase, string.ascii_lowercase)
                 selector = '%s[contains(%s, "%s")]' % (selector, trans, value.lower())
-        elems = node.xpath(selector, namespaces=NS)
+        if NS:
+            elems = node.xpath(selector, namespaces=NS)
+        else:
+            elems = cls.xpath(node, selector)
         # remove the root node
-        # if we have a selection tag
-        if node in elems and (tag or childs):
-            elems.remove(node)
+        # if we have a selection tag, it can only come first
+        if elems and (tag or childs) and elems[0] == node:
+            del elems[0]
         return elems
 
     @classmethod
@@ -170,7 +306,7 @@ class Parser(object):
     def getElementsByTags(cls, node, tags):
         selector = 'descendant::*[%s]' % (
             ' or '.join('self::%s' % tag for tag in tags))
-        elems = node.xpath(selector)
+        elems = cls.xpath(node, selector)
         return elems
 
     @classmethod
@@ -183,7 +319,7 @@ class Parser(object):
 
     @classmethod
     def getComments(cls, node):
-        return node.xpath('//comment()')
+        return cls.xpath(node, '//comment()')
 
     @classmethod
     def getParent(cls, node):
@@ -212,8 +348,27 @@ class Parser(object):
 
     @classmethod
     def getText(cls, node):
-        txts = [i for i in node.itertext()]
-        return text.innerTrim(' '.join(txts).strip())
+        return text.innerTrim(' '.join(node.itertext()))
+
+    @classmethod
+    def getTextWords(cls, node):
+        """The whitespace separated words of getText(node), which is
+        just them joined by single spaces
+        """
+        return ' '.join(node.itertext()).split()
+
+    @classmethod
+    def hasMoreTextThan(cls, node, count):
+        """Whether `node` holds more than `count` non-whitespace characters
+        of text, in which case getText(node) is longer than `count` too.
+        Stops reading text as soon as that is known.
+        """
+        for txt in node.itertext():
+            for word in txt.split():
+                count -= len(word)
+            if count < 0:
+                return True
+        return False
 
     @classmethod
     def previousSiblings(cls, node):
@@ -222,6 +377,13 @@ class Parser(object):
         """
         return [n for n in node.itersiblings(preceding=True)]
 
+    @classmethod
+    def iterPreviousSiblings(cls, node):
+        """
+            previousSiblings, yielded one at a time
+        """
+        return node.itersiblings(preceding=True)
+
     @classmethod
     def previousSibling(cls, node):
         return node.getprevious()
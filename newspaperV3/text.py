@@ -18,10 +18,9 @@ TABSSPACE = re.compile(r'[\s\t]+')
 
 def innerTrim(value):
     if isinstance(value, str):
-        # remove tab and white space
-        value = re.sub(TABSSPACE, ' ', value)
-        value = ''.join(value.splitlines())
-        return value.strip()
+        # remove tab and white space. Line breaks are whitespace too, so
+        # none are left to join afterwards
+        return TABSSPACE.sub(' ', value).strip()
     return ''
 
 
@@ -59,6 +58,7 @@ class WordStats(object):
 class StopWords(object):
 
     TRANS_TABLE = str.maketrans('', '')
+    PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
     _cached_stop_words = {}
 
     def __init__(self, language='en'):
@@ -71,13 +71,9 @@ class StopWords(object):
     def remove_punctuation(self, content):
         # code taken form
         # http://stackoverflow.com/questions/265960/best-way-to-strip-punctuation-from-a-string-in-python
-        content_is_unicode = isinstance(content, str)
-        if content_is_unicode:
-            content = content.encode('utf-8')
-        trans_table = {ord(c): None for c in string.punctuation}
-        stripped_input = content.decode('utf-8').translate(trans_table)
-
-        return stripped_input
+        if not isinstance(content, str):
+            content = content.decode('utf-8')
+        return content.translate(self.PUNCTUATION_TABLE)
 
     def candidate_words(self, stripped_input):
         return stripped_input.split(' ')
@@ -87,15 +83,12 @@ class StopWords(object):
             return WordStats()
         ws = WordStats()
         stripped_input = self.remove_punctuation(content)
-        candidate_words = self.candidate_words(stripped_input.lower())
-        overlapping_stopwords = []
-        c = 0
-        for w in candidate_words:
-            c += 1
-            if w in self.STOP_WORDS:
-                overlapping_stopwords.append(w)
+        candidate_words = list(self.candidate_words(stripped_input.lower()))
+        stop_words = self.STOP_WORDS
+        overlapping_stopwords = [
+            w for w in candidate_words if w in stop_words]
 
-        ws.set_word_count(c)
+        ws.set_word_count(len(candidate_words))
         ws.set_stopword_count(len(overlapping_stopwords))
         ws.set_stop_words(overlapping_stopwords)
         return ws
@@ -0,0 +1,21 @@
+import time
+
+import lxml.html
+
+from newspaperV3.configuration import Configuration
+from newspaperV3.extractors import ContentExtractor
+
+
+def test_relative_publish_date_follows_the_clock():
+    """A relative date is resolved against the time of each call, not the
+    first call's
+    """
+    extractor = ContentExtractor(Configuration())
+    doc = lxml.html.fromstring(
+        '<html><head><meta property="article:published_time" content="yesterday">'
+        '</head><body><p>Story</p></body></html>')
+    first = extractor.get_publishing_date('http://example.com/news/story', doc)
+    time.sleep(0.05)
+    second = extractor.get_publishing_date('http://example.com/news/story', doc)
+    assert first is not None and second is not None
+    assert first != second